@@ -1,5 +1,7 @@
 """Configuration constants and mappings for the food truck simulation."""
 
+from enum import IntEnum
+
 # Simulation parameters
 DROWSINESS_CHANCE = 0.30
 HAS_CAR_PERCENTAGE = 0.30
@@ -35,66 +37,126 @@ FUZZY_THRESHOLD_MEDIUM = 70  # Medium confidence match
 # High calorie threshold
 HIGH_CALORIE_THRESHOLD = 600
 
+# MenuItem.feature_mask bits, precomputed once per item for bonus scoring
+FEATURE_SWEET = 1 << 0  # sub_type is sweet
+FEATURE_SAVORY = 1 << 1  # sub_type is savory
+FEATURE_ENERGY_BOOST = 1 << 2  # energy_boost is set
+FEATURE_HIGH_CALORIE = 1 << 3  # calories >= HIGH_CALORIE_THRESHOLD
+FEATURE_HEALTHY = 1 << 4  # category matches a healthy mood
+FEATURE_JUNK = 1 << 5  # category matches a junk mood (fried or sweet)
+
+# Vendor kinds, stored on each vendor class as VENDOR_KIND
+VENDOR_TRUCK = 0
+VENDOR_SCHOOL = 1
+VENDOR_FASTFOOD = 2
+
 # School lunch daily menu selection counts
 SCHOOL_LUNCH_DAILY_FOOD_COUNT = 3
 SCHOOL_LUNCH_DAILY_DRINK_COUNT = 2
 
-# Q4_MoneyForLunch + IncomeLevel → Base Money mapping
-# Key: (Q4_MoneyForLunch, IncomeLevel) → base_money
-MONEY_MAPPING = {
-    ("Less than $7", "Low"): 5.00,
-    ("Less than $7", "Medium"): 6.00,
-    ("Less than $7", "High"): 6.50,
-    ("$7-$10", "Low"): 7.50,
-    ("$7-$10", "Medium"): 8.50,
-    ("$7-$10", "High"): 9.50,
-    ("More than $10", "Low"): 10.50,
-    ("More than $10", "Medium"): 12.00,
-    ("More than $10", "High"): 14.00,
-}
+# Survey answers are parsed once into these ordinals; the per-answer
+# tables below are tuples indexed by them.
+
+
+class IncomeLevel(IntEnum):
+    """IncomeLevel values."""
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    UNKNOWN = 3  # Any other value in the data
+
+
+class SpendOnDrink(IntEnum):
+    """Q1_SpendOnDrink answers."""
+
+    LESS_THAN_2 = 0  # "Less than $2"
+    FROM_2_TO_3 = 1  # "$2-$3"
+    FROM_3_TO_5 = 2  # "$3-$5"
+    MORE_THAN_5 = 3  # "More than $5"
+
+
+class HealthGoal(IntEnum):
+    """Q2_HealthGoal answers."""
+
+    LOSE = 0  # "Lose weight"
+    MAINTAIN = 1  # "Maintain weight"
+    GAIN = 2  # "Gain weight/muscle"
+    NOT_FOCUSED = 3  # "Not focused on weight"
+
+
+class Metabolism(IntEnum):
+    """Q3_Metabolism answers."""
+
+    FAST = 0  # "Fast - I can eat a lot without gaining weight"
+    SLOW = 1  # "Slow - I get full easily"
+    AVERAGE = 2  # "Average"
+
+
+class MoneyForLunch(IntEnum):
+    """Q4_MoneyForLunch answers."""
+
+    LESS_THAN_7 = 0  # "Less than $7"
+    FROM_7_TO_10 = 1  # "$7-$10"
+    MORE_THAN_10 = 2  # "More than $10"
+
+
+class ActivityLevel(IntEnum):
+    """Q5_ActivityLevel answers."""
+
+    VERY_ACTIVE = 0  # "Very active (exercise daily)"
+    ACTIVE = 1  # "Active (exercise 3-4 times a week)"
+    NOT_VERY_ACTIVE = 2  # "Not very active"
+
+
+class HealthyImportance(IntEnum):
+    """Q6_HealthyImportance answers."""
+
+    VERY = 0  # "Very important - I always try to choose nutritious options"
+    SOMEWHAT = 1  # "Somewhat important - I try to balance healthy and tasty"
+    NOT_REALLY = 2  # "Not really important - I just eat what tastes good"
+
+
+class WantsSweet(IntEnum):
+    """Q7_WantsSweet answers."""
+
+    YES = 0  # "Yes, I often crave something sweet"
+    SOMETIMES = 1  # "Sometimes"
+    RARELY = 2  # "Rarely"
+    NO = 3  # "No, I prefer savory"
+
+
+# Q4_MoneyForLunch + IncomeLevel → Base Money
+# Row: MoneyForLunch, column: IncomeLevel → base_money
+MONEY_DEFAULT = 8.50  # Used when the income level is unrecognized
+MONEY_TABLE = (
+    (5.00, 6.00, 6.50, MONEY_DEFAULT),
+    (7.50, 8.50, 9.50, MONEY_DEFAULT),
+    (10.50, 12.00, 14.00, MONEY_DEFAULT),
+)
 
 # Q6_HealthyImportance → Healthy Mood Probability
-HEALTHY_MOOD_PROBABILITY = {
-    "Very important - I always try to choose nutritious options": 0.75,
-    "Somewhat important - I try to balance healthy and tasty": 0.50,
-    "Not really important - I just eat what tastes good": 0.25,
-}
+HEALTHY_MOOD_PROBABILITY = (0.75, 0.50, 0.25)
 
 # Q7_WantsSweet → Sweet preference
-# True if student wants sweet items
-SWEET_PREFERENCE_VALUES = {
-    "Yes, I often crave something sweet": True,
-    "Sometimes": True,  # Treat as partial preference
-    "Rarely": False,
-    "No, I prefer savory": False,
-}
+# True if student wants sweet items ("Sometimes" is treated as partial preference)
+SWEET_PREFERENCE_VALUES = (True, True, False, False)
+
+# Q7_WantsSweet → Savory preference
+SAVORY_PREFERENCE_VALUES = (False, False, False, True)
 
 # Q1_SpendOnDrink → Drink spend willingness (multiplier)
-DRINK_SPEND_MAPPING = {
-    "Less than $2": 1.5,
-    "$2-$3": 2.5,
-    "$3-$5": 4.0,
-    "More than $5": 6.0,
-}
+DRINK_SPEND = (1.5, 2.5, 4.0, 6.0)
 
-# Q5_ActivityLevel values for high activity check
-HIGH_ACTIVITY_LEVELS = {
-    "Very active (exercise daily)",
-    "Active (exercise 3-4 times a week)",
-}
+# Q5_ActivityLevel → high activity check
+HIGH_ACTIVITY_LEVELS = (True, True, False)
 
-# Q3_Metabolism values for high metabolism check
-HIGH_METABOLISM_VALUES = {
-    "Fast - I can eat a lot without gaining weight",
-}
+# Q3_Metabolism → high metabolism check
+HIGH_METABOLISM_VALUES = (True, False, False)
 
 # Q2_HealthGoal modifier for healthy mood probability
-HEALTH_GOAL_MODIFIER = {
-    "Lose weight": 0.10,  # More likely healthy mood
-    "Maintain weight": 0.0,
-    "Gain weight/muscle": -0.05,  # Slightly less health-focused
-    "Not focused on weight": 0.0,
-}
+# Losing weight makes a healthy mood more likely; gaining slightly less
+HEALTH_GOAL_MODIFIER = (0.10, 0.0, -0.05, 0.0)
 
 # Loss reasons
 LOSS_REASON_SCHOOL_LUNCH = "school_lunch"
@@ -125,8 +187,12 @@ DRINK_CATEGORIES = {
     "coffee",       # Coffee and tea drinks
 }
 
+# Sub types (for sub_type field)
+SUB_TYPE_SWEET = "sweet"
+SUB_TYPE_SAVORY = "savory"
+
 # Valid sub_types
-VALID_SUB_TYPES = {"sweet", "savory"}
+VALID_SUB_TYPES = {SUB_TYPE_SWEET, SUB_TYPE_SAVORY}
 
 # Non-purchasing students (absent / brought lunch)
 NON_PURCHASING_MEAN = 425
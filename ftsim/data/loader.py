@@ -1,10 +1,20 @@
 """Data loading utilities for the food truck simulation."""
 
-import csv
+import functools
 import json
-import random
+import os
+import re
+import sys
 from pathlib import Path
-from typing import List, Dict, Any, NamedTuple
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson  # Optional: faster JSON menu parsing
+except ImportError:
+    orjson = None
 
 from ..models.student import StudentProfile
 from ..models.menu_item import MenuItem
@@ -15,110 +25,221 @@ from ..config import (
     VALID_SUB_TYPES,
     ITEM_TYPE_FOOD,
     ITEM_TYPE_DRINK,
+    IncomeLevel,
+    SpendOnDrink,
+    HealthGoal,
+    Metabolism,
+    MoneyForLunch,
+    ActivityLevel,
+    HealthyImportance,
+    WantsSweet,
 )
 
 
-def _parse_q4_money(q4_value: str) -> str:
+def _column(df: pd.DataFrame, name: str, default: str = "") -> pd.Series:
+    """Get a string column, falling back to a constant if it is missing."""
+    if name in df:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=str)
+
+
+def _factorize(values: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    """Split a column into integer codes and its distinct values.
+
+    Survey answers come from a handful of fixed choices, so normalizers only
+    scan the distinct values and broadcast the result back through the codes.
+    """
+    codes, distinct = pd.factorize(values)
+    return codes, pd.Series(distinct, dtype=str)
+
+
+def _ladder(**groups: str) -> re.Pattern:
+    """Compile an if/elif keyword ladder into one case-insensitive regex.
+
+    Each named group is a lookahead tried in order from the start of the
+    value, so the first group with a keyword anywhere in the string wins,
+    exactly like the ladder it replaces, in a single regex scan.
+    """
+    alternatives = "|".join(
+        f"(?=.*?(?P<{name}>{keywords}))" for name, keywords in groups.items()
+    )
+    return re.compile(f"^(?:{alternatives})", re.IGNORECASE | re.DOTALL)
+
+
+def _normalize(
+    values: pd.Series,
+    pattern: re.Pattern,
+    labels: Dict[Optional[str], int],
+) -> np.ndarray:
+    """Map raw survey answers to canonical ordinals, dispatching on the matched group.
+
+    Args:
+        values: Raw survey answers
+        pattern: Ladder regex built by _ladder()
+        labels: Canonical ordinal per group name, with None as the fallback
+
+    Returns:
+        Array of canonical ordinals
+    """
+    codes, distinct = _factorize(values)
+    matched = distinct.str.extract(pattern).notna().to_numpy()
+    canonical = np.select(
+        list(matched.T),
+        [labels[name] for name in pattern.groupindex],
+        default=labels[None],
+    )
+    return canonical[codes]
+
+
+_Q4_RE = _ladder(low="less than|low", high="more than|high")
+_Q4_MAP = {
+    "low": MoneyForLunch.LESS_THAN_7,
+    "high": MoneyForLunch.MORE_THAN_10,
+    None: MoneyForLunch.FROM_7_TO_10,
+}
+
+_Q6_RE = _ladder(very="very important", somewhat="somewhat")
+_Q6_MAP = {
+    "very": HealthyImportance.VERY,
+    "somewhat": HealthyImportance.SOMEWHAT,
+    None: HealthyImportance.NOT_REALLY,
+}
+
+_Q7_RE = _ladder(yes="yes|always", sometimes="sometimes", rarely="rarely")
+_Q7_MAP = {
+    "yes": WantsSweet.YES,
+    "sometimes": WantsSweet.SOMETIMES,
+    "rarely": WantsSweet.RARELY,
+    None: WantsSweet.NO,
+}
+
+_Q5_RE = _ladder(very="very active|sports team", active="active|sometimes|somewhat")
+_Q5_MAP = {
+    "very": ActivityLevel.VERY_ACTIVE,
+    "active": ActivityLevel.ACTIVE,
+    None: ActivityLevel.NOT_VERY_ACTIVE,
+}
+
+_Q3_RE = _ladder(fast="fast|eat a lot|hungry", slow="slow|full")
+_Q3_MAP = {
+    "fast": Metabolism.FAST,
+    "slow": Metabolism.SLOW,
+    None: Metabolism.AVERAGE,
+}
+
+_Q2_RE = _ladder(lose="lose", gain="gain|muscle|stronger", maintain="maintain")
+_Q2_MAP = {
+    "lose": HealthGoal.LOSE,
+    "gain": HealthGoal.GAIN,
+    "maintain": HealthGoal.MAINTAIN,
+    None: HealthGoal.NOT_FOCUSED,
+}
+
+_Q1_RE = _ladder(over4=r"\$4|more", about3=r"\$3", about2=r"\$2")
+_Q1_MAP = {
+    "over4": SpendOnDrink.MORE_THAN_5,
+    "about3": SpendOnDrink.FROM_3_TO_5,
+    "about2": SpendOnDrink.FROM_2_TO_3,
+    None: SpendOnDrink.LESS_THAN_2,
+}
+
+# IncomeLevel values are used verbatim, so they are matched exactly
+_INCOME_MAP = {
+    "Low": IncomeLevel.LOW,
+    "Medium": IncomeLevel.MEDIUM,
+    "High": IncomeLevel.HIGH,
+}
+
+
+def _parse_income(income_values: pd.Series) -> np.ndarray:
+    """Map IncomeLevel values to IncomeLevel ordinals."""
+    codes, distinct = _factorize(income_values)
+    canonical = np.array(
+        [_INCOME_MAP.get(value, IncomeLevel.UNKNOWN) for value in distinct],
+        dtype=np.int8,
+    )
+    return canonical[codes]
+
+
+def _parse_q4_money(q4_values: pd.Series) -> np.ndarray:
     """Normalize Q4_MoneyForLunch values."""
-    q4_lower = q4_value.lower()
-    if "less than" in q4_lower or "low" in q4_lower:
-        return "Less than $7"
-    elif "more than" in q4_lower or "high" in q4_lower:
-        return "More than $10"
-    else:
-        return "$7-$10"
+    return _normalize(q4_values, _Q4_RE, _Q4_MAP)
 
 
-def _parse_q6_healthy(q6_value: str) -> str:
+def _parse_q6_healthy(q6_values: pd.Series) -> np.ndarray:
     """Normalize Q6_HealthyImportance values."""
-    q6_lower = q6_value.lower()
-    if "very important" in q6_lower:
-        return "Very important - I always try to choose nutritious options"
-    elif "somewhat" in q6_lower:
-        return "Somewhat important - I try to balance healthy and tasty"
-    else:
-        return "Not really important - I just eat what tastes good"
+    return _normalize(q6_values, _Q6_RE, _Q6_MAP)
 
 
-def _parse_q7_sweet(q7_value: str) -> str:
+def _parse_q7_sweet(q7_values: pd.Series) -> np.ndarray:
     """Normalize Q7_WantsSweet values."""
-    q7_lower = q7_value.lower()
-    if "yes" in q7_lower or "always" in q7_lower:
-        return "Yes, I often crave something sweet"
-    elif "sometimes" in q7_lower:
-        return "Sometimes"
-    elif "rarely" in q7_lower:
-        return "Rarely"
-    else:
-        return "No, I prefer savory"
+    return _normalize(q7_values, _Q7_RE, _Q7_MAP)
 
 
-def _parse_q5_activity(q5_value: str) -> str:
+def _parse_q5_activity(q5_values: pd.Series) -> np.ndarray:
     """Normalize Q5_ActivityLevel values."""
-    q5_lower = q5_value.lower()
-    if "very active" in q5_lower or "sports team" in q5_lower:
-        return "Very active (exercise daily)"
-    elif "active" in q5_lower or "sometimes" in q5_lower or "somewhat" in q5_lower:
-        return "Active (exercise 3-4 times a week)"
-    else:
-        return "Not very active"
+    return _normalize(q5_values, _Q5_RE, _Q5_MAP)
 
 
-def _parse_q3_metabolism(q3_value: str) -> str:
+def _parse_q3_metabolism(q3_values: pd.Series) -> np.ndarray:
     """Normalize Q3_Metabolism values."""
-    q3_lower = q3_value.lower()
-    if "fast" in q3_lower or "eat a lot" in q3_lower or "hungry" in q3_lower:
-        return "Fast - I can eat a lot without gaining weight"
-    elif "slow" in q3_lower or "full" in q3_lower:
-        return "Slow - I get full easily"
-    else:
-        return "Average"
+    return _normalize(q3_values, _Q3_RE, _Q3_MAP)
 
 
-def _parse_q2_health_goal(q2_value: str) -> str:
+def _parse_q2_health_goal(q2_values: pd.Series) -> np.ndarray:
     """Normalize Q2_HealthGoal values."""
-    q2_lower = q2_value.lower()
-    if "lose" in q2_lower:
-        return "Lose weight"
-    elif "gain" in q2_lower or "muscle" in q2_lower or "stronger" in q2_lower:
-        return "Gain weight/muscle"
-    elif "maintain" in q2_lower:
-        return "Maintain weight"
-    else:
-        return "Not focused on weight"
+    return _normalize(q2_values, _Q2_RE, _Q2_MAP)
 
 
-def _parse_q1_spend(q1_value: str) -> str:
+def _parse_q1_spend(q1_values: pd.Series) -> np.ndarray:
     """Normalize Q1_SpendOnDrink values."""
-    q1_lower = q1_value.lower()
-    if "$4" in q1_lower or "more" in q1_lower:
-        return "More than $5"
-    elif "$3" in q1_lower:
-        return "$3-$5"
-    elif "$2" in q1_lower:
-        return "$2-$3"
-    else:
-        return "Less than $2"
-
-
-def _drink_to_rank(drink_name: str) -> Dict[str, int]:
-    """Map drink name to drink category for ranking."""
-    drink_lower = drink_name.lower()
-
-    categories = {
-        "water": ["water", "sparkling water"],
-        "soda": ["pepsi", "coca-cola", "coke", "dr pepper", "sprite", "fanta", "mountain dew"],
-        "juice": ["juice", "lemonade", "tea"],
-        "energy_drink": ["red bull", "monster", "rockstar", "bang", "energy"],
-        "coffee_tea": ["coffee", "iced coffee", "milk"],
-    }
-
-    for category, keywords in categories.items():
-        for keyword in keywords:
-            if keyword in drink_lower:
-                return category
-
-    return "soda"  # Default
+    return _normalize(q1_values, _Q1_RE, _Q1_MAP)
+
+
+# Drink rank categories, in StudentProfile column order, with the keywords
+# that map a survey drink name onto each category
+_DRINK_CATEGORIES = {
+    "water": ["water", "sparkling water"],
+    "soda": ["pepsi", "coca-cola", "coke", "dr pepper", "sprite", "fanta", "mountain dew"],
+    "juice": ["juice", "lemonade", "tea"],
+    "energy_drink": ["red bull", "monster", "rockstar", "bang", "energy"],
+    "coffee_tea": ["coffee", "iced coffee", "milk"],
+}
+_DRINK_RE = _ladder(**{
+    category: "|".join(re.escape(kw) for kw in keywords)
+    for category, keywords in _DRINK_CATEGORIES.items()
+})
+_DRINK_MAP: Dict[Optional[str], int] = {
+    category: idx for idx, category in enumerate(_DRINK_CATEGORIES)
+}
+_DRINK_MAP[None] = _DRINK_MAP["soda"]  # Default
+
+
+def _drink_to_rank(drink_names: pd.Series) -> np.ndarray:
+    """Map drink names to drink category indices for ranking."""
+    return _normalize(drink_names, _DRINK_RE, _DRINK_MAP)
+
+
+# Survey columns load_students reads; anything else is skipped by the parser
+_FOOD_COLUMNS = frozenset({
+    "StudentID",
+    "IncomeLevel",
+    "Q2_HealthGoal",
+    "Q3_Metabolism",
+    "Q4_MoneyForLunch",
+    "Q5_ActivityLevel",
+    "Q6_HealthyImportance",
+    "Q7_WantsSweet",
+    "Q8_LunchChoice",
+})
+_DRINK_COLUMNS = frozenset({"Q1_SpendOnDrink", "Rank1_Drink", "Rank2_Drink", "Rank3_Drink"})
+
+
+def _file_key(path: str) -> Tuple[str, int, int]:
+    """Cache key for a data file: absolute path, mtime and size."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
 
 
 def load_students(
@@ -128,6 +249,12 @@ def load_students(
 ) -> List[StudentProfile]:
     """Load and merge student data from CSV files.
 
+    Both CSVs are read as columnar frames and each survey answer column is
+    normalized in a single vectorized pass; only the final StudentProfile
+    construction loops in Python. Seeded loads are cached per file
+    (path, mtime, size) and seed, so editing either CSV invalidates the
+    cache; unseeded loads always draw fresh grades, genders and cars.
+
     Args:
         food_csv_path: Path to student_food.csv
         drink_csv_path: Path to drink_preferences_survey_500.csv
@@ -136,74 +263,148 @@ def load_students(
     Returns:
         List of 1000 StudentProfile objects
     """
-    if random_seed is not None:
-        random.seed(random_seed)
+    if random_seed is None:
+        return _read_students(food_csv_path, drink_csv_path, None)
+    students = _load_students_cached(
+        _file_key(food_csv_path), _file_key(drink_csv_path), random_seed
+    )
+    return list(students)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_students_cached(
+    food_key: Tuple[str, int, int],
+    drink_key: Tuple[str, int, int],
+    random_seed: int,
+) -> Tuple[StudentProfile, ...]:
+    """Load students for a (file key, file key, seed) triple.
+
+    The cached profiles are shared between calls, including their mutable
+    preference_cache, which each SimulationEngine clears on construction.
+    """
+    return tuple(_read_students(food_key[0], drink_key[0], random_seed))
+
+
+def _read_students(
+    food_csv_path: str,
+    drink_csv_path: str,
+    random_seed: Optional[int],
+) -> List[StudentProfile]:
+    """Read both survey CSVs and build one StudentProfile per food row."""
+    rng = np.random.default_rng(random_seed)
 
     # Load food preferences (1000 students)
-    food_data = {}
-    with open(food_csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            student_id = int(row["StudentID"])
-            food_data[student_id] = row
+    food_df = pd.read_csv(
+        food_csv_path,
+        usecols=_FOOD_COLUMNS.__contains__,
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8",
+    )
+    student_ids = food_df["StudentID"].astype(int)
+    n = len(food_df)
 
     # Load drink preferences (500 students)
-    drink_data_raw = []
-    with open(drink_csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            drink_data_raw.append(row)
-
-    # Double drink data to match 1000 students
-    drink_data = {}
-    for i, row in enumerate(drink_data_raw):
-        drink_data[i + 1] = row
-    for i, row in enumerate(drink_data_raw):
-        drink_data[i + 501] = row
-
-    # Assign has_car randomly to 20% of students
-    all_student_ids = list(food_data.keys())
-    num_with_cars = int(len(all_student_ids) * HAS_CAR_PERCENTAGE)
-    students_with_cars = set(random.sample(all_student_ids, num_with_cars))
+    drink_df = pd.read_csv(
+        drink_csv_path,
+        usecols=_DRINK_COLUMNS.__contains__,
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8",
+    )
+
+    # Reuse the 500 drink rows for all 1000 students by position
+    num_drink_rows = len(drink_df)
+    if num_drink_rows:
+        positions = (student_ids.to_numpy() - 1) % num_drink_rows
+        drink_df = drink_df.iloc[positions].reset_index(drop=True)
+    else:
+        drink_df = drink_df.reindex(range(n)).fillna({"Q1_SpendOnDrink": "About $2"}).fillna("")
+
+    # Assign random grade and gender (not in data) in one batch each
+    grades = rng.integers(9, 13, size=n)
+    genders = rng.choice(np.array(["M", "F"]), size=n)
+
+    # Assign has_car randomly to 30% of students: a one-byte-per-student mask
+    # filled from the head of a single Fisher-Yates permutation
+    has_car = np.zeros(n, dtype=bool)
+    has_car[rng.permutation(n)[:int(n * HAS_CAR_PERCENTAGE)]] = True
+
+    # Parse drink rankings from top 3 drinks
+    drink_ranks = np.full((n, len(_DRINK_CATEGORIES)), 5, dtype=np.int8)
+    rows = np.arange(n)
+    for rank_idx, rank_col in enumerate(["Rank1_Drink", "Rank2_Drink", "Rank3_Drink"], 1):
+        if rank_col not in drink_df:
+            continue
+        drink_names = drink_df[rank_col]
+        categories = _drink_to_rank(drink_names)
+        # Only update if not already ranked
+        update = (drink_names != "").to_numpy() & (drink_ranks[rows, categories] == 5)
+        drink_ranks[rows[update], categories[update]] = rank_idx
+
+    # Normalize survey answers column by column
+    columns = zip(
+        student_ids.tolist(),
+        grades.tolist(),
+        genders.tolist(),
+        _parse_income(_column(food_df, "IncomeLevel", "Medium")).tolist(),
+        _parse_q1_spend(_column(drink_df, "Q1_SpendOnDrink", "About $2")).tolist(),
+        _parse_q2_health_goal(_column(food_df, "Q2_HealthGoal")).tolist(),
+        _parse_q3_metabolism(_column(food_df, "Q3_Metabolism")).tolist(),
+        _parse_q4_money(_column(food_df, "Q4_MoneyForLunch")).tolist(),
+        _parse_q5_activity(_column(food_df, "Q5_ActivityLevel")).tolist(),
+        _parse_q6_healthy(_column(food_df, "Q6_HealthyImportance")).tolist(),
+        _parse_q7_sweet(_column(food_df, "Q7_WantsSweet")).tolist(),
+        # Many students share a favorite; intern so repeats share one string
+        map(sys.intern, _column(food_df, "Q8_LunchChoice").tolist()),
+        drink_ranks.tolist(),
+        has_car.tolist(),
+    )
 
     # Create StudentProfile objects
     students = []
-    for student_id, food_row in food_data.items():
-        drink_row = drink_data.get(student_id, {})
-
-        # Parse drink rankings from top 3 drinks
-        drink_ranks = {"water": 5, "soda": 5, "juice": 5, "energy_drink": 5, "coffee_tea": 5}
-        for rank_idx, rank_col in enumerate(["Rank1_Drink", "Rank2_Drink", "Rank3_Drink"], 1):
-            if rank_col in drink_row and drink_row[rank_col]:
-                category = _drink_to_rank(drink_row[rank_col])
-                if drink_ranks[category] == 5:  # Only update if not already ranked
-                    drink_ranks[category] = rank_idx
-
+    for student_id, grade, gender, income, q1, q2, q3, q4, q5, q6, q7, q8, ranks, car in columns:
+        water, soda, juice, energy_drink, coffee_tea = ranks
         profile = StudentProfile(
             student_id=student_id,
-            grade=random.randint(9, 12),  # Assign random grade if not in data
-            gender=random.choice(["M", "F"]),  # Assign random if not in data
-            income_level=food_row.get("IncomeLevel", "Medium"),
-            q1_spend_on_drink=_parse_q1_spend(drink_row.get("Q1_SpendOnDrink", "About $2")),
-            q2_health_goal=_parse_q2_health_goal(food_row.get("Q2_HealthGoal", "")),
-            q3_metabolism=_parse_q3_metabolism(food_row.get("Q3_Metabolism", "")),
-            q4_money_for_lunch=_parse_q4_money(food_row.get("Q4_MoneyForLunch", "")),
-            q5_activity_level=_parse_q5_activity(food_row.get("Q5_ActivityLevel", "")),
-            q6_healthy_importance=_parse_q6_healthy(food_row.get("Q6_HealthyImportance", "")),
-            q7_wants_sweet=_parse_q7_sweet(food_row.get("Q7_WantsSweet", "")),
-            q8_lunch_choice=food_row.get("Q8_LunchChoice", ""),
-            water_rank=drink_ranks["water"],
-            soda_rank=drink_ranks["soda"],
-            juice_rank=drink_ranks["juice"],
-            energy_drink_rank=drink_ranks["energy_drink"],
-            coffee_tea_rank=drink_ranks["coffee_tea"],
-            has_car=student_id in students_with_cars,
+            grade=grade,
+            gender=gender,
+            income_level=income,
+            q1_spend_on_drink=q1,
+            q2_health_goal=q2,
+            q3_metabolism=q3,
+            q4_money_for_lunch=q4,
+            q5_activity_level=q5,
+            q6_healthy_importance=q6,
+            q7_wants_sweet=q7,
+            q8_lunch_choice=q8,
+            water_rank=water,
+            soda_rank=soda,
+            juice_rank=juice,
+            energy_drink_rank=energy_drink,
+            coffee_tea_rank=coffee_tea,
+            has_car=car,
         )
         students.append(profile)
 
     return students
 
 
+# Required menu item fields, in the order missing ones are reported
+_REQUIRED_FIELDS = (
+    "name",
+    "price",
+    "health_rating",
+    "type",
+    "category",
+    "sub_type",
+    "energy_boost",
+    "inventory_per_day",
+    "calories",
+)
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+
 class MenuData(NamedTuple):
     """Container for loaded menu data."""
     name: str
@@ -214,6 +415,8 @@ def load_menu(menu_path: str) -> MenuData:
     """Load menu from JSON or YAML file.
 
     All fields are required. See README.md for field documentation.
+    Parsed menus are cached per (absolute path, mtime, size), so editing
+    the file invalidates the cache; each call still returns fresh MenuItems.
 
     Args:
         menu_path: Path to menu file (JSON or YAML)
@@ -224,16 +427,36 @@ def load_menu(menu_path: str) -> MenuData:
     Raises:
         ValueError: If required fields are missing or have invalid values
     """
+    company_name, item_fields = _load_menu_cached(*_file_key(menu_path))
+    return MenuData(
+        name=company_name,
+        items=[MenuItem(**fields) for fields in item_fields],
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _load_menu_cached(
+    menu_path: str, mtime_ns: int, size: int
+) -> Tuple[str, Tuple[Dict[str, Any], ...]]:
+    """Parse and validate a menu file into MenuItem constructor arguments.
+
+    The mtime and size arguments only form part of the cache key. The
+    returned field dicts are shared between calls and must not be mutated.
+    """
     path = Path(menu_path)
 
-    with open(path, encoding="utf-8") as f:
-        if path.suffix.lower() in (".yaml", ".yml"):
+    if path.suffix.lower() in (".yaml", ".yml"):
+        with open(path, encoding="utf-8") as f:
             try:
                 import yaml
                 data = yaml.safe_load(f)
             except ImportError:
                 raise ImportError("PyYAML is required to load YAML files. Install with: pip install pyyaml")
-        else:
+    elif orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, encoding="utf-8") as f:
             data = json.load(f)
 
     # Extract company name
@@ -245,25 +468,15 @@ def load_menu(menu_path: str) -> MenuData:
     company_name = company_name.strip()
 
     items = []
-    required_fields = [
-        "name",
-        "price",
-        "health_rating",
-        "type",
-        "category",
-        "sub_type",
-        "energy_boost",
-        "inventory_per_day",
-        "calories",
-    ]
 
     for idx, item_data in enumerate(data.get("items", [])):
         item_name = item_data.get("name", f"Item {idx + 1}")
 
         # Validate all required fields are present
-        for field in required_fields:
-            if field not in item_data:
-                raise ValueError(f"Menu item '{item_name}' missing required field: {field}")
+        missing = _REQUIRED_FIELD_SET.difference(item_data)
+        if missing:
+            field = next(f for f in _REQUIRED_FIELDS if f in missing)
+            raise ValueError(f"Menu item '{item_name}' missing required field: {field}")
 
         # Validate type
         item_type = item_data["type"]
@@ -321,20 +534,19 @@ def load_menu(menu_path: str) -> MenuData:
         if calories < 0:
             raise ValueError(f"Menu item '{item_name}' has invalid calories {calories}. Must be non-negative")
 
-        item = MenuItem(
-            name=item_data["name"],
-            price=price,
-            health_rating=health_rating,
-            item_type=item_type,
-            category=category,
-            sub_type=sub_type,
-            energy_boost=bool(item_data["energy_boost"]),
-            inventory_per_day=inventory,
-            calories=calories,
-        )
-        items.append(item)
+        items.append({
+            "name": item_data["name"],
+            "price": price,
+            "health_rating": health_rating,
+            "item_type": item_type,
+            "category": category,
+            "sub_type": sub_type,
+            "energy_boost": bool(item_data["energy_boost"]),
+            "inventory_per_day": inventory,
+            "calories": calories,
+        })
 
     if not items:
         raise ValueError("Menu file contains no items")
 
-    return MenuData(name=company_name, items=items)
+    return company_name, tuple(items)
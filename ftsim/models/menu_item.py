@@ -1,9 +1,22 @@
 """MenuItem model for food truck menu items."""
 
+import sys
 from dataclasses import dataclass, field
 
+from ..config import (
+    HIGH_CALORIE_THRESHOLD,
+    SUB_TYPE_SWEET,
+    SUB_TYPE_SAVORY,
+    FEATURE_SWEET,
+    FEATURE_SAVORY,
+    FEATURE_ENERGY_BOOST,
+    FEATURE_HIGH_CALORIE,
+    FEATURE_HEALTHY,
+    FEATURE_JUNK,
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class MenuItem:
     """Represents a menu item sold by the food truck.
 
@@ -20,32 +33,49 @@ class MenuItem:
     inventory_per_day: int
     calories: int
 
-    # Runtime inventory tracking
-    _current_inventory: int = field(default=0, repr=False)
+    # Position in the owning FoodTruck's inventory array (-1 if untracked)
+    menu_idx: int = field(default=-1, init=False, repr=False)
 
-    def __post_init__(self) -> None:
-        """Initialize current inventory."""
-        self._current_inventory = self.inventory_per_day
+    # Price in integer cents, used for revenue accounting
+    price_cents: int = field(default=0, init=False, repr=False)
 
-    def reset_inventory(self) -> None:
-        """Reset inventory to daily maximum."""
-        self._current_inventory = self.inventory_per_day
+    # Scoring features derived from the fields above (FEATURE_* bits)
+    feature_mask: int = field(default=0, init=False, repr=False)
 
-    def is_available(self) -> bool:
-        """Check if item is in stock."""
-        return self._current_inventory > 0
+    # Lowercased category and health_rating scaled to 0-1, used by scoring
+    category_lower: str = field(default="", init=False, repr=False)
+    health_score: float = field(default=0.0, init=False, repr=False)
 
-    def sell_one(self) -> bool:
-        """Sell one unit. Returns True if successful, False if out of stock."""
-        if self._current_inventory > 0:
-            self._current_inventory -= 1
-            return True
-        return False
+    def __post_init__(self) -> None:
+        """Intern label fields and derive cents and scoring features."""
+        # Names key the per-day counters and fuzzy score table
+        self.name = sys.intern(self.name)
+        # Labels come from a tiny closed set; interning them lets hot-path
+        # checks compare against the config constants by identity
+        self.item_type = sys.intern(self.item_type)
+        self.category = sys.intern(self.category)
+        self.sub_type = sys.intern(self.sub_type)
+        self.price_cents = round(self.price * 100)
+        self.feature_mask = self._compute_feature_mask()
+        self.category_lower = sys.intern(self.category.lower())
+        self.health_score = self.health_rating / 10.0
 
-    @property
-    def current_inventory(self) -> int:
-        """Get current inventory level."""
-        return self._current_inventory
+    def _compute_feature_mask(self) -> int:
+        """Pack the per-item scoring conditions into FEATURE_* bits."""
+        mask = 0
+        if self.sub_type is SUB_TYPE_SWEET:
+            mask |= FEATURE_SWEET
+        elif self.sub_type is SUB_TYPE_SAVORY:
+            mask |= FEATURE_SAVORY
+        if self.energy_boost:
+            mask |= FEATURE_ENERGY_BOOST
+        if self.calories >= HIGH_CALORIE_THRESHOLD:
+            mask |= FEATURE_HIGH_CALORIE
+        if self.category == "healthy":
+            mask |= FEATURE_HEALTHY
+        elif self.category in ("fried", "sweet"):
+            mask |= FEATURE_JUNK
+        return mask
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON export."""
@@ -59,5 +89,4 @@ class MenuItem:
             "energy_boost": self.energy_boost,
             "inventory_per_day": self.inventory_per_day,
             "calories": self.calories,
-            "current_inventory": self._current_inventory,
         }
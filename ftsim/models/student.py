@@ -1,24 +1,34 @@
 """Student models for the food truck simulation."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
 
+from .menu_item import MenuItem
+from ..config import (
+    SWEET_PREFERENCE_VALUES,
+    SAVORY_PREFERENCE_VALUES,
+    HIGH_ACTIVITY_LEVELS,
+    HIGH_METABOLISM_VALUES,
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StudentProfile:
     """Immutable student profile data loaded from CSVs."""
 
     student_id: int
     grade: int
     gender: str
-    income_level: str  # Low, Medium, High
-    q1_spend_on_drink: str
-    q2_health_goal: str
-    q3_metabolism: str
-    q4_money_for_lunch: str
-    q5_activity_level: str
-    q6_healthy_importance: str
-    q7_wants_sweet: str
+
+    # Survey answers as ordinals of the matching config IntEnum
+    income_level: int  # IncomeLevel
+    q1_spend_on_drink: int  # SpendOnDrink
+    q2_health_goal: int  # HealthGoal
+    q3_metabolism: int  # Metabolism
+    q4_money_for_lunch: int  # MoneyForLunch
+    q5_activity_level: int  # ActivityLevel
+    q6_healthy_importance: int  # HealthyImportance
+    q7_wants_sweet: int  # WantsSweet
     q8_lunch_choice: str
 
     # Drink preferences (ranks 1-5, lower is better)
@@ -31,8 +41,42 @@ class StudentProfile:
     # Assigned attributes
     has_car: bool
 
+    # Scoring traits derived from the answers above, fixed for the run
+    wants_sweet: bool = field(default=False, init=False, repr=False, compare=False)
+    prefers_savory: bool = field(default=False, init=False, repr=False, compare=False)
+    is_active: bool = field(default=False, init=False, repr=False, compare=False)
+    has_high_metabolism: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # Drink category -> rank
+    drink_ranks: Dict[str, int] = field(default=None, init=False, repr=False, compare=False)
+
+    # Memo of (item name, type, category) -> preference scores, filled by
+    # scoring. Mutable despite the frozen profile: SimulationEngine clears
+    # it on construction so it only holds the current run's menus
+    preference_cache: Dict[Tuple[str, str, str], Tuple[float, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Derive the scoring traits once per profile."""
+        # Frozen dataclass: derived fields go through object.__setattr__
+        set_field = object.__setattr__
+        set_field(self, "wants_sweet", SWEET_PREFERENCE_VALUES[self.q7_wants_sweet])
+        set_field(self, "prefers_savory", SAVORY_PREFERENCE_VALUES[self.q7_wants_sweet])
+        set_field(self, "is_active", HIGH_ACTIVITY_LEVELS[self.q5_activity_level])
+        set_field(self, "has_high_metabolism", HIGH_METABOLISM_VALUES[self.q3_metabolism])
+        set_field(self, "drink_ranks", {
+            "energy": self.energy_drink_rank,
+            "soda": self.soda_rank,
+            "juice": self.juice_rank,
+            "water": self.water_rank,
+            "milk": self.coffee_tea_rank,  # Grouped with coffee/tea in survey
+            "coffee": self.coffee_tea_rank,
+        })
+        set_field(self, "preference_cache", {})
 
-@dataclass
+
+@dataclass(slots=True)
 class StudentDailyState:
     """Daily randomized state for a student."""
 
@@ -41,27 +85,53 @@ class StudentDailyState:
     mood: str  # "healthy" or "junk"
     is_drowsy: bool
 
-    # Decision tracking
-    purchased_items: list = None
-    total_spent: float = 0.0
+    # Decision tracking; most students buy nothing, so the purchase lists
+    # stay a shared empty tuple until the first add_purchase()
+    purchased_items: Sequence[MenuItem] = None
+    total_spent_cents: int = 0
     chose_school_lunch: bool = False
     chose_fast_food: bool = False
     loss_reason: Optional[str] = None
     purchased_from_truck: Optional[str] = None
 
-    def __post_init__(self):
-        if self.purchased_items is None:
-            self.purchased_items = []
+    # Names of purchased_items, kept in step by add_purchase()
+    purchased_names: Sequence[str] = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        if not self.purchased_items:
+            self.purchased_items = ()
+            self.purchased_names = ()
+        else:
+            self.purchased_items = list(self.purchased_items)
+            self.purchased_names = [item.name for item in self.purchased_items]
+
+    def add_purchase(self, item: MenuItem) -> None:
+        """Record a purchased item and its price."""
+        if self.purchased_items:
+            self.purchased_items.append(item)
+            self.purchased_names.append(item.name)
+        else:
+            self.purchased_items = [item]
+            self.purchased_names = [item.name]
+        self.total_spent_cents += item.price_cents
+
+    @property
+    def total_spent(self) -> float:
+        """Total spent in dollars."""
+        return self.total_spent_cents / 100
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON export."""
+        """Convert to dictionary for JSON export.
+
+        The purchased_items list is shared with the state, not copied.
+        """
         return {
             "student_id": self.student_id,
             "available_money": self.available_money,
             "mood": self.mood,
             "is_drowsy": self.is_drowsy,
-            "purchased_items": [item.name for item in self.purchased_items],
-            "total_spent": self.total_spent,
+            "purchased_items": self.purchased_names,
+            "total_spent": self.total_spent_cents / 100,
             "chose_school_lunch": self.chose_school_lunch,
             "chose_fast_food": self.chose_fast_food,
             "loss_reason": self.loss_reason,
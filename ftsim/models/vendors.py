@@ -1,86 +1,195 @@
 """Vendor models for the food truck simulation."""
 
 import random
+import sys
 from dataclasses import dataclass, field
-from typing import List
+from functools import cache
+from typing import ClassVar, List, Optional, Tuple
+
+import numpy as np
 
 from .menu_item import MenuItem
 from ..config import (
+    ITEM_TYPE_FOOD,
+    ITEM_TYPE_DRINK,
     SCHOOL_LUNCH_DAILY_FOOD_COUNT,
     SCHOOL_LUNCH_DAILY_DRINK_COUNT,
+    VENDOR_TRUCK,
+    VENDOR_SCHOOL,
+    VENDOR_FASTFOOD,
 )
 
-# Unlimited inventory sentinel
+# Unlimited inventory sentinel; competitor items are never stock-tracked
 _UNLIMITED = 9999
 
 
 @dataclass
 class FoodTruck:
-    """The player's food truck with inventory management."""
+    """The player's food truck with inventory management.
+
+    Stock levels live in one int32 array indexed by each item's menu_idx.
+    Available-item lists are cached and only rebuilt when availability
+    changes (an item sells out or inventory is reset). Callers must not
+    mutate the returned lists.
+    """
+
+    VENDOR_KIND: ClassVar[int] = VENDOR_TRUCK
 
     name: str
     menu: List[MenuItem] = field(default_factory=list)
 
+    # Daily maximum and current stock per menu position
+    _max_inventory: np.ndarray = field(init=False, repr=False, compare=False)
+    _inventory: np.ndarray = field(init=False, repr=False, compare=False)
+
+    # Bumped whenever availability changes; caches are valid for one version
+    _inventory_version: int = field(default=0, init=False, repr=False)
+    _cache_version: int = field(default=-1, init=False, repr=False)
+    _avail_items: List[MenuItem] = field(default_factory=list, init=False, repr=False)
+    _avail_food: List[MenuItem] = field(default_factory=list, init=False, repr=False)
+    _avail_drinks: List[MenuItem] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Students record the truck by name; interned names hash and compare
+        # by identity in the engine's per-purchase lookup
+        self.name = sys.intern(self.name)
+        for idx, item in enumerate(self.menu):
+            item.menu_idx = idx
+        self._max_inventory = np.array(
+            [item.inventory_per_day for item in self.menu], dtype=np.int32
+        )
+        self._inventory = self._max_inventory.copy()
+
+    @property
+    def inventory(self) -> np.ndarray:
+        """Current stock per menu position. Callers must not modify it."""
+        return self._inventory
+
     def reset_inventory(self) -> None:
         """Reset all menu items to daily inventory levels."""
-        for item in self.menu:
-            item.reset_inventory()
+        np.copyto(self._inventory, self._max_inventory)
+        self._inventory_version += 1
+
+    def is_available(self, item: MenuItem) -> bool:
+        """Check if an item is in stock."""
+        return self._inventory[item.menu_idx] > 0
+
+    def get_sold_out_flags(self) -> np.ndarray:
+        """Get a 0/1 flag per menu position for items that sold out today.
+
+        Stock only goes down between resets, so an item with a daily
+        maximum above zero and no stock left ran out at some point today.
+        """
+        return ((self._max_inventory > 0) & (self._inventory == 0)).astype(np.int32)
+
+    def _refresh_available(self) -> None:
+        """Rebuild the available item caches in one pass if they are stale."""
+        if self._cache_version == self._inventory_version:
+            return
+        items, food, drinks = [], [], []
+        for idx in np.flatnonzero(self._inventory).tolist():
+            item = self.menu[idx]
+            items.append(item)
+            if item.item_type is ITEM_TYPE_FOOD:
+                food.append(item)
+            elif item.item_type is ITEM_TYPE_DRINK:
+                drinks.append(item)
+        self._avail_items = items
+        self._avail_food = food
+        self._avail_drinks = drinks
+        self._cache_version = self._inventory_version
 
     def get_available_items(self) -> List[MenuItem]:
         """Get list of items currently in stock."""
-        return [item for item in self.menu if item.is_available()]
+        self._refresh_available()
+        return self._avail_items
 
     def get_available_food(self) -> List[MenuItem]:
         """Get available food items."""
-        return [item for item in self.get_available_items() if item.item_type == "food"]
+        self._refresh_available()
+        return self._avail_food
 
     def get_available_drinks(self) -> List[MenuItem]:
         """Get available drink items."""
-        return [item for item in self.get_available_items() if item.item_type == "drink"]
+        self._refresh_available()
+        return self._avail_drinks
 
     def sell_item(self, item: MenuItem) -> bool:
         """Attempt to sell an item. Returns True if successful."""
-        return item.sell_one()
+        idx = item.menu_idx
+        stock = self._inventory[idx]
+        if stock <= 0:
+            return False
+        self._inventory[idx] = stock - 1
+        if stock == 1:
+            self._inventory_version += 1
+        return True
 
 
 # ---------------------------------------------------------------------------
 # School Lunch
 # ---------------------------------------------------------------------------
 
-_SCHOOL_LUNCH_FOOD_POOL: List[MenuItem] = [
-    MenuItem("Chicken Tenders", 3.50, 5, "food", "fried", "savory", False, _UNLIMITED, 450),
-    MenuItem("Spaghetti w/ Meat Sauce", 3.00, 6, "food", "savory", "savory", False, _UNLIMITED, 500),
-    MenuItem("Grilled Cheese", 2.50, 5, "food", "savory", "savory", False, _UNLIMITED, 400),
-    MenuItem("Turkey Sandwich", 3.00, 7, "food", "healthy", "savory", False, _UNLIMITED, 350),
-    MenuItem("Bean & Cheese Burrito", 3.00, 6, "food", "savory", "savory", False, _UNLIMITED, 480),
-    MenuItem("Garden Salad", 2.00, 9, "food", "healthy", "savory", False, _UNLIMITED, 180),
-    MenuItem("Fish Sticks", 3.00, 5, "food", "fried", "savory", False, _UNLIMITED, 400),
-    MenuItem("Mac & Cheese", 2.50, 4, "food", "savory", "savory", False, _UNLIMITED, 450),
-    MenuItem("Veggie Burger", 3.50, 7, "food", "healthy", "savory", False, _UNLIMITED, 320),
-    MenuItem("Hamburger", 3.50, 5, "food", "fried", "savory", False, _UNLIMITED, 500),
-]
-
-_SCHOOL_LUNCH_DRINK_POOL: List[MenuItem] = [
-    MenuItem("Chocolate Milk", 1.50, 5, "drink", "milk", "sweet", False, _UNLIMITED, 200),
-    MenuItem("Apple Juice", 1.50, 7, "drink", "juice", "sweet", False, _UNLIMITED, 120),
-    MenuItem("Fruit Punch", 1.50, 4, "drink", "juice", "sweet", False, _UNLIMITED, 150),
-    MenuItem("Water", 0.00, 10, "drink", "water", "savory", False, _UNLIMITED, 0),
-    MenuItem("Low-Fat Milk", 1.50, 8, "drink", "milk", "savory", False, _UNLIMITED, 110),
-]
+@cache
+def _school_lunch_pools() -> Tuple[Tuple[MenuItem, ...], Tuple[MenuItem, ...]]:
+    """Build the (food, drink) school lunch pools on first use.
+
+    The pool items are shared by every SchoolLunch and every day's menu.
+    MenuItem holds no per-day state, so sharing them is safe.
+    """
+    food_pool = (
+        MenuItem("Chicken Tenders", 3.50, 5, "food", "fried", "savory", False, _UNLIMITED, 450),
+        MenuItem("Spaghetti w/ Meat Sauce", 3.00, 6, "food", "savory", "savory", False, _UNLIMITED, 500),
+        MenuItem("Grilled Cheese", 2.50, 5, "food", "savory", "savory", False, _UNLIMITED, 400),
+        MenuItem("Turkey Sandwich", 3.00, 7, "food", "healthy", "savory", False, _UNLIMITED, 350),
+        MenuItem("Bean & Cheese Burrito", 3.00, 6, "food", "savory", "savory", False, _UNLIMITED, 480),
+        MenuItem("Garden Salad", 2.00, 9, "food", "healthy", "savory", False, _UNLIMITED, 180),
+        MenuItem("Fish Sticks", 3.00, 5, "food", "fried", "savory", False, _UNLIMITED, 400),
+        MenuItem("Mac & Cheese", 2.50, 4, "food", "savory", "savory", False, _UNLIMITED, 450),
+        MenuItem("Veggie Burger", 3.50, 7, "food", "healthy", "savory", False, _UNLIMITED, 320),
+        MenuItem("Hamburger", 3.50, 5, "food", "fried", "savory", False, _UNLIMITED, 500),
+    )
+    drink_pool = (
+        MenuItem("Chocolate Milk", 1.50, 5, "drink", "milk", "sweet", False, _UNLIMITED, 200),
+        MenuItem("Apple Juice", 1.50, 7, "drink", "juice", "sweet", False, _UNLIMITED, 120),
+        MenuItem("Fruit Punch", 1.50, 4, "drink", "juice", "sweet", False, _UNLIMITED, 150),
+        MenuItem("Water", 0.00, 10, "drink", "water", "savory", False, _UNLIMITED, 0),
+        MenuItem("Low-Fat Milk", 1.50, 8, "drink", "milk", "savory", False, _UNLIMITED, 110),
+    )
+    return food_pool, drink_pool
 
 
 @dataclass
 class SchoolLunch:
-    """School lunch competitor — cheap, moderately healthy, daily rotating menu."""
+    """School lunch competitor — cheap, moderately healthy, daily rotating menu.
+
+    The get_available_* methods return today's lists without copying;
+    callers must not mutate them.
+    """
+
+    VENDOR_KIND: ClassVar[int] = VENDOR_SCHOOL
 
     name: str = "School Lunch"
     daily_menu: List[MenuItem] = field(default_factory=list)
 
-    def generate_daily_menu(self) -> None:
-        """Pick random food + drink items from the pool for today's menu."""
-        food_picks = random.sample(_SCHOOL_LUNCH_FOOD_POOL, SCHOOL_LUNCH_DAILY_FOOD_COUNT)
-        drink_picks = random.sample(_SCHOOL_LUNCH_DRINK_POOL, SCHOOL_LUNCH_DAILY_DRINK_COUNT)
+    # Today's menu split by type, fixed until the next generate_daily_menu()
+    _daily_food: List[MenuItem] = field(default_factory=list, init=False, repr=False)
+    _daily_drinks: List[MenuItem] = field(default_factory=list, init=False, repr=False)
+
+    def generate_daily_menu(self, rng: Optional[random.Random] = None) -> None:
+        """Pick random food + drink items from the pool for today's menu.
+
+        Args:
+            rng: Random generator to pick with (default: the global random module)
+        """
+        if rng is None:
+            rng = random
+        food_pool, drink_pool = _school_lunch_pools()
+        food_picks = rng.sample(food_pool, SCHOOL_LUNCH_DAILY_FOOD_COUNT)
+        drink_picks = rng.sample(drink_pool, SCHOOL_LUNCH_DAILY_DRINK_COUNT)
         self.daily_menu = food_picks + drink_picks
+        self._daily_food = food_picks
+        self._daily_drinks = drink_picks
 
     # -- duck-typed interface matching FoodTruck for scoring --
 
@@ -88,14 +197,20 @@ class SchoolLunch:
     def menu(self) -> List[MenuItem]:
         return self.daily_menu
 
+    @property
+    def pool(self) -> Tuple[MenuItem, ...]:
+        """Every item that can appear on a daily menu."""
+        food_pool, drink_pool = _school_lunch_pools()
+        return food_pool + drink_pool
+
     def get_available_items(self) -> List[MenuItem]:
-        return list(self.daily_menu)
+        return self.daily_menu
 
     def get_available_food(self) -> List[MenuItem]:
-        return [item for item in self.daily_menu if item.item_type == "food"]
+        return self._daily_food
 
     def get_available_drinks(self) -> List[MenuItem]:
-        return [item for item in self.daily_menu if item.item_type == "drink"]
+        return self._daily_drinks
 
     def to_dict(self) -> dict:
         return {
@@ -107,40 +222,62 @@ class SchoolLunch:
 # Fast Food (Burger Joint)
 # ---------------------------------------------------------------------------
 
-_BURGER_JOINT_MENU: List[MenuItem] = [
-    MenuItem("Cheeseburger", 6.00, 3, "food", "fried", "savory", False, _UNLIMITED, 550),
-    MenuItem("Double Bacon Burger", 9.00, 2, "food", "fried", "savory", False, _UNLIMITED, 900),
-    MenuItem("Chicken Nuggets (10pc)", 7.00, 3, "food", "fried", "savory", False, _UNLIMITED, 480),
-    MenuItem("Large Fries", 5.00, 2, "food", "fried", "savory", False, _UNLIMITED, 500),
-    MenuItem("Hot Dog", 5.00, 3, "food", "fried", "savory", False, _UNLIMITED, 400),
-    MenuItem("Large Soda", 3.00, 1, "drink", "soda", "sweet", False, _UNLIMITED, 250),
-    MenuItem("Chocolate Shake", 6.00, 2, "drink", "milk", "sweet", False, _UNLIMITED, 700),
-    MenuItem("Sweet Tea", 3.00, 2, "drink", "juice", "sweet", False, _UNLIMITED, 180),
-]
+@cache
+def _burger_joint_menu() -> Tuple[Tuple[MenuItem, ...], Tuple[MenuItem, ...], Tuple[MenuItem, ...]]:
+    """Build the burger joint (menu, food, drinks) tuples on first use.
+
+    The items are shared by every FastFood instance.
+    """
+    menu = (
+        MenuItem("Cheeseburger", 6.00, 3, "food", "fried", "savory", False, _UNLIMITED, 550),
+        MenuItem("Double Bacon Burger", 9.00, 2, "food", "fried", "savory", False, _UNLIMITED, 900),
+        MenuItem("Chicken Nuggets (10pc)", 7.00, 3, "food", "fried", "savory", False, _UNLIMITED, 480),
+        MenuItem("Large Fries", 5.00, 2, "food", "fried", "savory", False, _UNLIMITED, 500),
+        MenuItem("Hot Dog", 5.00, 3, "food", "fried", "savory", False, _UNLIMITED, 400),
+        MenuItem("Large Soda", 3.00, 1, "drink", "soda", "sweet", False, _UNLIMITED, 250),
+        MenuItem("Chocolate Shake", 6.00, 2, "drink", "milk", "sweet", False, _UNLIMITED, 700),
+        MenuItem("Sweet Tea", 3.00, 2, "drink", "juice", "sweet", False, _UNLIMITED, 180),
+    )
+    food = tuple(item for item in menu if item.item_type is ITEM_TYPE_FOOD)
+    drinks = tuple(item for item in menu if item.item_type is ITEM_TYPE_DRINK)
+    return menu, food, drinks
 
 
 @dataclass
 class FastFood:
-    """Burger joint competitor — expensive, junky, requires car access."""
+    """Burger joint competitor — expensive, junky, requires car access.
+
+    The get_available_* methods return the shared menu tuples directly.
+    """
+
+    VENDOR_KIND: ClassVar[int] = VENDOR_FASTFOOD
 
     name: str = "Burger Joint"
 
+    # Shared burger joint menu, built on first construction
+    _menu: Tuple[MenuItem, ...] = field(default=(), init=False, repr=False)
+    _food: Tuple[MenuItem, ...] = field(default=(), init=False, repr=False)
+    _drinks: Tuple[MenuItem, ...] = field(default=(), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._menu, self._food, self._drinks = _burger_joint_menu()
+
     # -- duck-typed interface matching FoodTruck for scoring --
 
     @property
-    def menu(self) -> List[MenuItem]:
-        return _BURGER_JOINT_MENU
+    def menu(self) -> Tuple[MenuItem, ...]:
+        return self._menu
 
-    def get_available_items(self) -> List[MenuItem]:
-        return list(_BURGER_JOINT_MENU)
+    def get_available_items(self) -> Tuple[MenuItem, ...]:
+        return self._menu
 
-    def get_available_food(self) -> List[MenuItem]:
-        return [item for item in _BURGER_JOINT_MENU if item.item_type == "food"]
+    def get_available_food(self) -> Tuple[MenuItem, ...]:
+        return self._food
 
-    def get_available_drinks(self) -> List[MenuItem]:
-        return [item for item in _BURGER_JOINT_MENU if item.item_type == "drink"]
+    def get_available_drinks(self) -> Tuple[MenuItem, ...]:
+        return self._drinks
 
     def to_dict(self) -> dict:
         return {
-            "menu": [item.name for item in _BURGER_JOINT_MENU],
+            "menu": [item.name for item in self._menu],
         }
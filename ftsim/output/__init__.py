@@ -1,11 +1,24 @@
 """Output package."""
 
-from .results import DailyResult, AggregateResult
-from .reporter import print_daily_summary, print_aggregate_summary
+from .results import (
+    TruckDailyResult,
+    StudentStates,
+    DailyResult,
+    TruckAggregateResult,
+    CompetitionAggregateResult,
+    AggregateResult,
+)
+from .reporter import print_daily_summary, print_aggregate_summary, export_csv, export_json
 
 __all__ = [
+    "TruckDailyResult",
+    "StudentStates",
     "DailyResult",
+    "TruckAggregateResult",
+    "CompetitionAggregateResult",
     "AggregateResult",
     "print_daily_summary",
     "print_aggregate_summary",
+    "export_csv",
+    "export_json",
 ]
@@ -2,157 +2,206 @@
 
 import csv
 import json
+import sys
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List
 
-from .results import DailyResult, CompetitionAggregateResult
+try:
+    import orjson  # Optional: faster JSON encoding for exports
+except ImportError:
+    orjson = None
+
+from .results import DailyResult, CompetitionAggregateResult, _sort_counts
+
+# Export write buffer; large files are flushed in 256 KiB chunks
+_EXPORT_BUFFER_SIZE = 1 << 18
+
+# Daily CSV rows are written in batches of this many rows
+_CSV_BATCH_ROWS = 1024
+
+# Characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules)
+_CSV_SPECIAL_CHARS = frozenset(',"\r\n')
 
 
 def print_daily_summary(result: DailyResult) -> None:
     """Print summary for a single day."""
-    print(f"\n{'=' * 60}")
-    print(f"Day {result.day} Summary")
-    print(f"{'=' * 60}")
-    print(f"School Lunch Menu: {', '.join(result.school_lunch_menu)}")
+    lines: List[str] = []
+    lines.append(f"\n{'=' * 60}")
+    lines.append(f"Day {result.day} Summary")
+    lines.append(f"{'=' * 60}")
+    lines.append(f"School Lunch Menu: {', '.join(result.school_lunch_menu)}")
 
     # Print per-truck results
+    # With no students every truck has 0 customers, so any non-zero divisor gives 0%
+    total_students = result.total_students or 1
     for truck_name, truck_result in result.truck_results.items():
-        print(f"\n--- {truck_name} ---")
-        print(f"Revenue: ${truck_result.revenue:.2f}")
-        customer_pct = (
-            truck_result.customers / result.total_students * 100
-            if result.total_students > 0
-            else 0
-        )
-        print(f"Customers: {truck_result.customers} ({customer_pct:.1f}%)")
+        lines.append(f"\n--- {truck_name} ---")
+        lines.append(f"Revenue: ${truck_result.revenue:.2f}")
+        customer_pct = truck_result.customers / total_students * 100
+        lines.append(f"Customers: {truck_result.customers} ({customer_pct:.1f}%)")
 
         if truck_result.items_sold:
-            print("Items Sold:")
-            for item_name, count in sorted(
-                truck_result.items_sold.items(), key=lambda x: -x[1]
-            ):
-                print(f"  {item_name}: {count}")
-
-        stockout_items = [
-            item_name
-            for item_name, count in truck_result.stockouts.items()
-            if count > 0
-        ]
-        if stockout_items:
-            print("Stockouts: " + ", ".join(stockout_items))
+            lines.append("Items Sold:")
+            for item_name, count in truck_result.sorted_items_sold:
+                lines.append(f"  {item_name}: {count}")
+
+        if truck_result.stockout_items:
+            lines.append("Stockouts: " + ", ".join(truck_result.stockout_items))
 
     # Print combined stats
-    print(f"\n--- Combined ---")
-    print(f"Total Revenue: ${result.revenue:.2f}")
-    print(f"Total Customers: {result.customers}/{result.total_students}")
+    lines.append(f"\n--- Combined ---")
+    lines.append(f"Total Revenue: ${result.revenue:.2f}")
+    lines.append(f"Total Customers: {result.customers}/{result.total_students}")
 
     if result.losses_by_reason:
-        print("\nLost Sales:")
-        for reason, count in sorted(result.losses_by_reason.items(), key=lambda x: -x[1]):
-            print(f"  {reason}: {count}")
+        lines.append("\nLost Sales:")
+        for reason, count in _sort_counts(result.losses_by_reason):
+            lines.append(f"  {reason}: {count}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_aggregate_summary(result: CompetitionAggregateResult) -> None:
     """Print aggregate summary for entire simulation."""
+    lines: List[str] = []
     truck_names = list(result.truck_results.keys())
     col_width = 15
     table_width = 25 + col_width * len(truck_names)
 
-    print(f"\n{'#' * table_width}")
-    print(f"SIMULATION COMPLETE - {result.total_days} Days")
-    print(f"{'#' * table_width}")
+    lines.append(f"\n{'#' * table_width}")
+    lines.append(f"SIMULATION COMPLETE - {result.total_days} Days")
+    lines.append(f"{'#' * table_width}")
 
     # Print winner banner
     winner_result = result.truck_results[result.winner]
-    print(f"\n{'*' * table_width}")
-    print(f"  WINNER: {result.winner}")
-    print(f"  Total Revenue: ${winner_result.total_revenue:.2f}")
-    print(f"{'*' * table_width}")
+    lines.append(f"\n{'*' * table_width}")
+    lines.append(f"  WINNER: {result.winner}")
+    lines.append(f"  Total Revenue: ${winner_result.total_revenue:.2f}")
+    lines.append(f"{'*' * table_width}")
 
     # Print head-to-head comparison
-    print("\n" + "=" * table_width)
-    print("HEAD-TO-HEAD COMPARISON")
-    print("=" * table_width)
-
-    # Header row
-    header = f"{'Metric':<25}"
+    lines.append("\n" + "=" * table_width)
+    lines.append("HEAD-TO-HEAD COMPARISON")
+    lines.append("=" * table_width)
+
+    # Header, revenue, customers and daily average rows, filled in one pass
+    header = [f"{'Metric':<25}"]
+    revenue_row = [f"{'Total Revenue':<25}"]
+    customers_row = [f"{'Total Customers':<25}"]
+    daily_revenue_row = [f"{'Avg Daily Revenue':<25}"]
+    daily_customers_row = [f"{'Avg Daily Customers':<25}"]
     for name in truck_names:
-        header += f"{name:>15}"
-    print(header)
-    print("-" * table_width)
-
-    # Revenue row
-    row = f"{'Total Revenue':<25}"
-    for name in truck_names:
-        row += f"${result.truck_results[name].total_revenue:>14,.2f}"
-    print(row)
-
-    # Customers row
-    row = f"{'Total Customers':<25}"
-    for name in truck_names:
-        row += f"{result.truck_results[name].total_customers:>15,}"
-    print(row)
-
-    # Daily revenue row
-    row = f"{'Avg Daily Revenue':<25}"
-    for name in truck_names:
-        row += f"${result.truck_results[name].avg_daily_revenue:>14,.2f}"
-    print(row)
-
-    # Daily customers row
-    row = f"{'Avg Daily Customers':<25}"
-    for name in truck_names:
-        row += f"{result.truck_results[name].avg_daily_customers:>15,.1f}"
-    print(row)
+        truck_result = result.truck_results[name]
+        header.append(f"{name:>15}")
+        revenue_row.append(f"${truck_result.total_revenue:>14,.2f}")
+        customers_row.append(f"{truck_result.total_customers:>15,}")
+        daily_revenue_row.append(f"${truck_result.avg_daily_revenue:>14,.2f}")
+        daily_customers_row.append(f"{truck_result.avg_daily_customers:>15,.1f}")
+
+    lines.append("".join(header))
+    lines.append("-" * table_width)
+    lines.append("".join(revenue_row))
+    lines.append("".join(customers_row))
+    lines.append("".join(daily_revenue_row))
+    lines.append("".join(daily_customers_row))
 
     # Print per-truck details
     for truck_name, truck_result in result.truck_results.items():
-        print(f"\n{'=' * table_width}")
-        print(f"{truck_name} - DETAILED RESULTS")
-        print(f"{'=' * table_width}")
+        lines.append(f"\n{'=' * table_width}")
+        lines.append(f"{truck_name} - DETAILED RESULTS")
+        lines.append(f"{'=' * table_width}")
 
-        print(f"\nTotal Revenue: ${truck_result.total_revenue:.2f}")
-        print(f"Total Customers: {truck_result.total_customers}")
-        print(f"Avg Daily Revenue: ${truck_result.avg_daily_revenue:.2f}")
-        print(f"Avg Daily Customers: {truck_result.avg_daily_customers:.1f}")
+        lines.append(f"\nTotal Revenue: ${truck_result.total_revenue:.2f}")
+        lines.append(f"Total Customers: {truck_result.total_customers}")
+        lines.append(f"Avg Daily Revenue: ${truck_result.avg_daily_revenue:.2f}")
+        lines.append(f"Avg Daily Customers: {truck_result.avg_daily_customers:.1f}")
 
         if truck_result.total_items_sold:
-            print("\nItems Sold (Total):")
-            for item_name, count in sorted(
-                truck_result.total_items_sold.items(), key=lambda x: -x[1]
-            ):
-                print(f"  {item_name}: {count}")
-
-        if truck_result.total_stockouts:
-            total_stockout_days = sum(truck_result.total_stockouts.values())
-            if total_stockout_days > 0:
-                print("\nStockouts (Days Sold Out):")
-                for item_name, days in sorted(
-                    truck_result.total_stockouts.items(), key=lambda x: -x[1]
-                ):
-                    if days > 0:
-                        print(f"  {item_name}: {days} days")
+            lines.append("\nItems Sold (Total):")
+            for item_name, count in truck_result.sorted_items_sold:
+                lines.append(f"  {item_name}: {count}")
+
+        if truck_result.sorted_stockouts:
+            lines.append("\nStockouts (Days Sold Out):")
+            for item_name, days in truck_result.sorted_stockouts:
+                lines.append(f"  {item_name}: {days} days")
 
     # Print combined stats
-    print(f"\n{'=' * 60}")
-    print("COMBINED STATISTICS")
-    print(f"{'=' * 60}")
-    print(f"Total Students Processed: {result.total_students_served}")
+    lines.append(f"\n{'=' * 60}")
+    lines.append("COMBINED STATISTICS")
+    lines.append(f"{'=' * 60}")
+    lines.append(f"Total Students Processed: {result.total_students_served}")
     customer_rate = (
         result.total_customers / result.total_students_served * 100
         if result.total_students_served > 0
         else 0
     )
-    print(f"Combined Customer Rate: {customer_rate:.1f}%")
+    lines.append(f"Combined Customer Rate: {customer_rate:.1f}%")
 
     if result.total_losses_by_reason:
-        print("\nLost Sales by Reason:")
+        lines.append("\nLost Sales by Reason:")
         total_losses = sum(result.total_losses_by_reason.values())
-        for reason, count in sorted(
-            result.total_losses_by_reason.items(), key=lambda x: -x[1]
-        ):
+        for reason, count in _sort_counts(result.total_losses_by_reason):
             pct = count / total_losses * 100 if total_losses > 0 else 0
-            print(f"  {reason}: {count} ({pct:.1f}%)")
+            lines.append(f"  {reason}: {count} ({pct:.1f}%)")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def export_json(
+    result: CompetitionAggregateResult,
+    output_path: str,
+    pretty: bool = False,
+) -> None:
+    """Export results to a single JSON file.
+
+    The document has the same shape as result.to_dict(), but daily results
+    are encoded and written one day at a time, so the nested dict for the
+    whole run is never held in memory.
+
+    Args:
+        result: Competition aggregate simulation results
+        output_path: Path of the JSON file to write
+        pretty: Indent the output by 2 spaces instead of writing compact JSON
+    """
+    json_path = Path(output_path)
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if pretty:
+        key_sep, outer_indent, inner_indent = b": ", b"\n  ", b"\n    "
+    else:
+        key_sep, outer_indent, inner_indent = b":", b"", b""
+
+    with open(json_path, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+        f.write(b"{")
+        for key, value in result.to_dict(include_daily=False).items():
+            f.write(outer_indent + _json_bytes(key) + key_sep)
+            f.write(_json_bytes(value, pretty, depth=1) + b",")
+        f.write(outer_indent + b'"daily_results"' + key_sep + b"[")
+        for i, daily_result in enumerate(result.daily_results):
+            if i:
+                f.write(b",")
+            f.write(inner_indent + _json_bytes(daily_result.to_dict(), pretty, depth=2))
+        if result.daily_results:
+            f.write(outer_indent)
+        f.write(b"]\n}" if pretty else b"]}")
+
+    print(f"\nResults exported to: {json_path}")
+
+
+def _json_bytes(value: Any, pretty: bool = False, depth: int = 0) -> bytes:
+    """Encode a value as UTF-8 JSON, compact or indented at the given depth."""
+    if not pretty:
+        if orjson is not None:
+            return orjson.dumps(value)
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    if orjson is not None:
+        encoded = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    else:
+        encoded = json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+    return encoded.replace(b"\n", b"\n" + b"  " * depth)
 
 
 def export_csv(
@@ -166,6 +215,11 @@ def export_csv(
     - menuN.csv: Daily aggregate data per truck
     - menuN_students.csv: Per-student purchase data per truck
 
+    All files are open at once and filled in a single streaming pass over
+    the daily results. Each day's student rows go to csv.writer.writerows
+    at once. Daily rows have a fixed schema, so they are formatted directly
+    and written every _CSV_BATCH_ROWS rows.
+
     Args:
         result: Competition aggregate simulation results
         output_dir: Directory to write CSV files
@@ -175,73 +229,78 @@ def export_csv(
     output_path.mkdir(parents=True, exist_ok=True)
 
     menu_prefixes = [f"menu{i}" for i in range(1, len(truck_order) + 1)]
-    for i, truck_name in enumerate(truck_order):
-        menu_prefix = menu_prefixes[i]
-        _write_daily_csv(result, output_path, truck_name, menu_prefix)
-        _write_student_csv(result, output_path, truck_name, menu_prefix)
+
+    with ExitStack() as stack:
+        daily_files = []
+        student_writers: Dict[str, list] = {}
+        for prefix, truck_name in zip(menu_prefixes, truck_order):
+            daily_file = _open_csv(stack, output_path / f"{prefix}.csv")
+            daily_file.write("day,revenue,customers,items_sold,stockouts\n")
+            daily_files.append((truck_name, daily_file, []))
+
+            student_writer = csv.writer(
+                _open_csv(stack, output_path / f"{prefix}_students.csv"), lineterminator="\n"
+            )
+            student_writer.writerow(["day", "student_id", "purchased_items", "total_spent"])
+            student_writers.setdefault(truck_name, []).append(student_writer)
+
+        for daily_result in result.daily_results:
+            for truck_name, daily_file, batch in daily_files:
+                batch.append(_daily_line(daily_result, truck_name))
+                if len(batch) >= _CSV_BATCH_ROWS:
+                    daily_file.write("".join(batch))
+                    batch.clear()
+            for truck_name, writers in student_writers.items():
+                rows = list(_iter_student_rows(daily_result, truck_name))
+                for student_writer in writers:
+                    student_writer.writerows(rows)
+
+        for _, daily_file, batch in daily_files:
+            daily_file.write("".join(batch))
 
     print(f"\nResults exported to: {output_path}/")
     for prefix, truck_name in zip(menu_prefixes, truck_order):
         print(f"  - {prefix}.csv, {prefix}_students.csv ({truck_name})")
 
 
-def _write_daily_csv(
-    result: CompetitionAggregateResult,
-    output_path: Path,
-    truck_name: str,
-    menu_prefix: str,
-) -> None:
-    """Write daily aggregate CSV for a single truck."""
-    csv_path = output_path / f"{menu_prefix}.csv"
-
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["day", "revenue", "customers", "items_sold", "stockouts"])
+def _open_csv(stack: ExitStack, csv_path: Path):
+    """Open a buffered CSV file for writing and register it on the stack."""
+    return stack.enter_context(
+        open(csv_path, "w", newline="", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE)
+    )
 
-        for daily_result in result.daily_results:
-            truck_result = daily_result.truck_results[truck_name]
 
-            # JSON-encode items_sold dict
-            items_sold_json = json.dumps(truck_result.items_sold)
+def _csv_field(value: str) -> str:
+    """Quote a string field the way csv.writer's QUOTE_MINIMAL would."""
+    if _CSV_SPECIAL_CHARS.isdisjoint(value):
+        return value
+    return '"' + value.replace('"', '""') + '"'
 
-            # Comma-separated list of stocked-out items
-            stockout_items = [
-                item for item, count in truck_result.stockouts.items() if count > 0
-            ]
-            stockouts_str = ",".join(stockout_items)
 
-            writer.writerow([
-                daily_result.day,
-                round(truck_result.revenue, 2),
-                truck_result.customers,
-                items_sold_json,
-                stockouts_str,
-            ])
+def _daily_line(daily_result: DailyResult, truck_name: str) -> str:
+    """Format the daily aggregate CSV line for a single truck."""
+    truck_result = daily_result.truck_results[truck_name]
 
+    # Comma-separated list of stocked-out items
+    stockouts_str = ",".join(truck_result.stockout_items)
 
-def _write_student_csv(
-    result: CompetitionAggregateResult,
-    output_path: Path,
-    truck_name: str,
-    menu_prefix: str,
-) -> None:
-    """Write per-student purchase CSV for a single truck."""
-    csv_path = output_path / f"{menu_prefix}_students.csv"
+    return (
+        f"{daily_result.day},{truck_result.revenue},{truck_result.customers},"
+        f"{_csv_field(truck_result.items_sold_json)},{_csv_field(stockouts_str)}\n"
+    )
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["day", "student_id", "purchased_items", "total_spent"])
 
-        for daily_result in result.daily_results:
-            for student_state in daily_result.student_states:
-                # Only include students who purchased from this truck
-                if student_state.get("purchased_from_truck") != truck_name:
-                    continue
-
-                purchased_items = ",".join(student_state.get("purchased_items", []))
-                writer.writerow([
-                    daily_result.day,
-                    student_state.get("student_id"),
-                    purchased_items,
-                    round(student_state.get("total_spent", 0), 2),
-                ])
+def _iter_student_rows(daily_result: DailyResult, truck_name: str) -> Iterator[tuple]:
+    """Yield per-student purchase CSV rows for one truck's customers."""
+    day = daily_result.day
+    states = daily_result.student_states
+    student_ids = states.student_id
+    purchased_items = states.purchased_items
+    total_spent_cents = states.total_spent_cents
+    for i in states.by_truck.get(truck_name, ()):
+        yield (
+            day,
+            student_ids[i],
+            ",".join(purchased_items[i]),
+            total_spent_cents[i] / 100,
+        )
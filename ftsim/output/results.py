@@ -1,33 +1,169 @@
 """Result dataclasses for the food truck simulation."""
 
+import json
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson  # Optional: faster JSON encoding for exports
+except ImportError:
+    orjson = None
+
+from ..models.student import StudentDailyState
+
+
+def _sort_counts(counts: Dict[str, int]) -> Tuple[Tuple[str, int], ...]:
+    """Freeze (name, count) pairs sorted by descending count, keeping ties in order."""
+    return tuple(sorted(counts.items(), key=itemgetter(1), reverse=True))
+
+
+@dataclass(slots=True)
 class TruckDailyResult:
     """Results for a single truck for a single day."""
 
     truck_name: str
-    revenue: float
+    revenue_cents: int
     customers: int
     items_sold: Dict[str, int]  # item_name -> count
     stockouts: Dict[str, int]  # item_name -> sold out (0 or 1)
 
+    # The same counts per menu position, when the producer tracks them;
+    # lets aggregation sum days as arrays instead of merging dicts
+    items_sold_counts: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    stockout_flags: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+
+    # Derived views, built on first use
+    _items_sold_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _sorted_items_sold: Optional[Tuple[Tuple[str, int], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _stockout_items: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def revenue(self) -> float:
+        """Revenue in dollars."""
+        return self.revenue_cents / 100
+
+    @property
+    def items_sold_json(self) -> str:
+        """items_sold encoded as a compact JSON object string.
+
+        The orjson and json paths produce identical text.
+        """
+        if self._items_sold_json is None:
+            if orjson is not None:
+                self._items_sold_json = orjson.dumps(self.items_sold).decode("utf-8")
+            else:
+                self._items_sold_json = json.dumps(
+                    self.items_sold, separators=(",", ":"), ensure_ascii=False
+                )
+        return self._items_sold_json
+
+    @property
+    def sorted_items_sold(self) -> Tuple[Tuple[str, int], ...]:
+        """(item_name, count) pairs, best sellers first."""
+        if self._sorted_items_sold is None:
+            self._sorted_items_sold = _sort_counts(self.items_sold)
+        return self._sorted_items_sold
+
+    @property
+    def stockout_items(self) -> Tuple[str, ...]:
+        """Names of items that sold out, in menu order."""
+        if self._stockout_items is None:
+            self._stockout_items = tuple(
+                item_name for item_name, count in self.stockouts.items() if count > 0
+            )
+        return self._stockout_items
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON export."""
         return {
             "truck_name": self.truck_name,
-            "revenue": round(self.revenue, 2),
+            "revenue": self.revenue,
             "customers": self.customers,
             "items_sold": self.items_sold,
             "stockouts": self.stockouts,
         }
 
 
-@dataclass
+@dataclass(slots=True)
+class StudentStates:
+    """One day's student outcomes stored column-wise.
+
+    Each list holds one entry per student in processing order, and
+    by_truck maps a truck name to the positions of the students who
+    bought from it.
+    """
+
+    student_id: List[int] = field(default_factory=list)
+    available_money: List[float] = field(default_factory=list)
+    mood: List[str] = field(default_factory=list)
+    is_drowsy: List[bool] = field(default_factory=list)
+    purchased_items: List[Sequence[str]] = field(default_factory=list)
+    total_spent_cents: List[int] = field(default_factory=list)
+    chose_school_lunch: List[bool] = field(default_factory=list)
+    chose_fast_food: List[bool] = field(default_factory=list)
+    loss_reason: List[Optional[str]] = field(default_factory=list)
+    purchased_from_truck: List[Optional[str]] = field(default_factory=list)
+    by_truck: Dict[str, List[int]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.student_id)
+
+    @classmethod
+    def from_states(cls, states: List[StudentDailyState]) -> "StudentStates":
+        """Build the columns from a day's final states in one pass per column."""
+        by_truck: Dict[str, List[int]] = {}
+        truck_names = [state.purchased_from_truck for state in states]
+        for i, truck_name in enumerate(truck_names):
+            if truck_name is not None:
+                by_truck.setdefault(truck_name, []).append(i)
+        return cls(
+            student_id=[state.student_id for state in states],
+            available_money=[state.available_money for state in states],
+            mood=[state.mood for state in states],
+            is_drowsy=[state.is_drowsy for state in states],
+            purchased_items=[state.purchased_names for state in states],
+            total_spent_cents=[state.total_spent_cents for state in states],
+            chose_school_lunch=[state.chose_school_lunch for state in states],
+            chose_fast_food=[state.chose_fast_food for state in states],
+            loss_reason=[state.loss_reason for state in states],
+            purchased_from_truck=truck_names,
+            by_truck=by_truck,
+        )
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert to one dictionary per student for JSON export."""
+        return [
+            {
+                "student_id": self.student_id[i],
+                "available_money": self.available_money[i],
+                "mood": self.mood[i],
+                "is_drowsy": self.is_drowsy[i],
+                "purchased_items": self.purchased_items[i],
+                "total_spent": self.total_spent_cents[i] / 100,
+                "chose_school_lunch": self.chose_school_lunch[i],
+                "chose_fast_food": self.chose_fast_food[i],
+                "loss_reason": self.loss_reason[i],
+                "purchased_from_truck": self.purchased_from_truck[i],
+            }
+            for i in range(len(self.student_id))
+        ]
+
+
+@dataclass(slots=True)
 class DailyResult:
-    """Results for a single day of simulation."""
+    """Results for a single day of simulation.
+
+    The combined totals across trucks are computed once at construction,
+    so truck_results must be complete when the result is created.
+    """
 
     day: int
     truck_results: Dict[str, TruckDailyResult]  # keyed by truck name
@@ -35,68 +171,92 @@ class DailyResult:
     total_students: int
     school_lunch_menu: List[str]
 
-    # Optional detailed state for export
-    student_states: List[Dict[str, Any]] = field(default_factory=list)
-
-    @property
-    def revenue(self) -> float:
-        """Total revenue across all trucks."""
-        return sum(tr.revenue for tr in self.truck_results.values())
+    # Optional detailed state for export; empty when the engine was told
+    # not to keep it
+    student_states: StudentStates = field(default_factory=StudentStates)
 
-    @property
-    def customers(self) -> int:
-        """Total customers across all trucks."""
-        return sum(tr.customers for tr in self.truck_results.values())
+    # Combined totals across all trucks
+    revenue_cents: int = field(default=0, init=False, repr=False, compare=False)
+    customers: int = field(default=0, init=False, repr=False, compare=False)
+    items_sold: Dict[str, int] = field(default=None, init=False, repr=False, compare=False)
+    stockouts: Dict[str, int] = field(default=None, init=False, repr=False, compare=False)
 
-    @property
-    def items_sold(self) -> Dict[str, int]:
-        """Combined items sold across all trucks."""
-        combined: Dict[str, int] = {}
+    def __post_init__(self) -> None:
+        items_sold: Counter = Counter()
+        stockouts: Counter = Counter()
         for tr in self.truck_results.values():
-            for item_name, count in tr.items_sold.items():
-                combined[item_name] = combined.get(item_name, 0) + count
-        return combined
+            items_sold.update(tr.items_sold)
+            stockouts.update(tr.stockouts)
+        self.revenue_cents = sum(tr.revenue_cents for tr in self.truck_results.values())
+        self.customers = sum(tr.customers for tr in self.truck_results.values())
+        self.items_sold = dict(items_sold)
+        self.stockouts = dict(stockouts)
 
     @property
-    def stockouts(self) -> Dict[str, int]:
-        """Combined stockouts across all trucks."""
-        combined: Dict[str, int] = {}
-        for tr in self.truck_results.values():
-            for item_name, count in tr.stockouts.items():
-                combined[item_name] = combined.get(item_name, 0) + count
-        return combined
+    def revenue(self) -> float:
+        """Total revenue across all trucks in dollars."""
+        return self.revenue_cents / 100
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON export."""
         return {
             "day": self.day,
             "truck_results": {name: tr.to_dict() for name, tr in self.truck_results.items()},
-            "total_revenue": round(self.revenue, 2),
+            "total_revenue": self.revenue,
             "total_customers": self.customers,
             "losses_by_reason": self.losses_by_reason,
             "total_students": self.total_students,
             "school_lunch_menu": self.school_lunch_menu,
-            "student_states": self.student_states,
+            "student_states": self.student_states.to_dicts(),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TruckAggregateResult:
     """Aggregated results for a single truck across all days."""
 
     truck_name: str
-    total_revenue: float
+    total_revenue_cents: int
     total_customers: int
     total_items_sold: Dict[str, int]
     total_stockouts: Dict[str, int]  # item_name -> days sold out
     avg_daily_revenue: float
     avg_daily_customers: float
 
+    # Derived views, built on first use
+    _sorted_items_sold: Optional[Tuple[Tuple[str, int], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sorted_stockouts: Optional[Tuple[Tuple[str, int], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def total_revenue(self) -> float:
+        """Total revenue in dollars."""
+        return self.total_revenue_cents / 100
+
+    @property
+    def sorted_items_sold(self) -> Tuple[Tuple[str, int], ...]:
+        """(item_name, count) pairs, best sellers first."""
+        if self._sorted_items_sold is None:
+            self._sorted_items_sold = _sort_counts(self.total_items_sold)
+        return self._sorted_items_sold
+
+    @property
+    def sorted_stockouts(self) -> Tuple[Tuple[str, int], ...]:
+        """(item_name, days) pairs for items that sold out, most days first."""
+        if self._sorted_stockouts is None:
+            self._sorted_stockouts = tuple(
+                pair for pair in _sort_counts(self.total_stockouts) if pair[1] > 0
+            )
+        return self._sorted_stockouts
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON export."""
         return {
             "truck_name": self.truck_name,
-            "total_revenue": round(self.total_revenue, 2),
+            "total_revenue": self.total_revenue,
             "total_customers": self.total_customers,
             "total_items_sold": self.total_items_sold,
             "total_stockouts": self.total_stockouts,
@@ -105,9 +265,12 @@ class TruckAggregateResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CompetitionAggregateResult:
-    """Aggregated results for head-to-head competition."""
+    """Aggregated results for head-to-head competition.
+
+    The combined totals across trucks are computed once at construction.
+    """
 
     total_days: int
     truck_results: Dict[str, TruckAggregateResult]  # keyed by truck name
@@ -118,35 +281,53 @@ class CompetitionAggregateResult:
     # All daily results for detailed analysis
     daily_results: List[DailyResult] = field(default_factory=list)
 
+    # Day x truck arrays, columns in truck_results order
+    daily_revenue_cents: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    daily_customers: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+
+    # Combined totals across all trucks
+    total_revenue_cents: int = field(default=0, init=False, repr=False, compare=False)
+    total_customers: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.total_revenue_cents = sum(
+            tr.total_revenue_cents for tr in self.truck_results.values()
+        )
+        self.total_customers = sum(tr.total_customers for tr in self.truck_results.values())
+
     @property
     def total_revenue(self) -> float:
-        """Total revenue across all trucks."""
-        return sum(tr.total_revenue for tr in self.truck_results.values())
+        """Total revenue across all trucks in dollars."""
+        return self.total_revenue_cents / 100
 
-    @property
-    def total_customers(self) -> int:
-        """Total customers across all trucks."""
-        return sum(tr.total_customers for tr in self.truck_results.values())
+    def to_dict(self, include_daily: bool = True) -> Dict[str, Any]:
+        """Convert to dictionary for JSON export.
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON export."""
-        return {
+        Args:
+            include_daily: Whether to include the per-day "daily_results" list
+        """
+        data = {
             "summary": {
                 "total_days": self.total_days,
-                "total_revenue": round(self.total_revenue, 2),
+                "total_revenue": self.total_revenue,
                 "total_customers": self.total_customers,
                 "total_losses_by_reason": self.total_losses_by_reason,
                 "total_students_served": self.total_students_served,
                 "winner": self.winner,
             },
             "truck_results": {name: tr.to_dict() for name, tr in self.truck_results.items()},
-            "daily_results": [dr.to_dict() for dr in self.daily_results],
         }
+        if include_daily:
+            data["daily_results"] = [dr.to_dict() for dr in self.daily_results]
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateResult:
-    """Aggregated results across all simulation days (legacy single-truck)."""
+    """Aggregated results across all simulation days (legacy single-truck).
+
+    Not produced by the engine; CompetitionAggregateResult replaces it.
+    """
 
     total_days: int
     total_revenue: float
@@ -1,6 +1,10 @@
 """Scoring logic for student purchase decisions."""
 
-from rapidfuzz import fuzz
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from ..models.menu_item import MenuItem
 from ..models.student import StudentProfile, StudentDailyState
@@ -17,18 +21,29 @@ from ..config import (
     BONUS_CATEGORY_MATCH,
     FUZZY_THRESHOLD_HIGH,
     FUZZY_THRESHOLD_MEDIUM,
-    HIGH_CALORIE_THRESHOLD,
-    SWEET_PREFERENCE_VALUES,
-    HIGH_ACTIVITY_LEVELS,
-    HIGH_METABOLISM_VALUES,
     ITEM_TYPE_DRINK,
+    FEATURE_SWEET,
+    FEATURE_SAVORY,
+    FEATURE_ENERGY_BOOST,
+    FEATURE_HIGH_CALORIE,
+    FEATURE_HEALTHY,
+    FEATURE_JUNK,
 )
 
 
-def _fuzzy_match_score(item_name: str, favorite: str) -> int:
+# (item_name, favorite) -> fuzzy score, filled by prime_fuzzy_scores or on demand
+_FUZZY_SCORES: Dict[Tuple[str, str], float] = {}
+
+# Every rapidfuzz strategy tried; the best one wins
+_FUZZY_SCORERS = (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio, fuzz.token_set_ratio)
+
+
+def _fuzzy_match_score(item_name: str, favorite: str) -> float:
     """Calculate fuzzy match score between item name and favorite food.
 
     Uses multiple fuzzy matching strategies and returns the best score.
+    Results are memoized: both strings are fixed for the whole run, so each
+    (item, favorite) pair is only scored once.
 
     Args:
         item_name: The menu item name
@@ -37,18 +52,42 @@ def _fuzzy_match_score(item_name: str, favorite: str) -> int:
     Returns:
         Fuzzy match score 0-100
     """
-    item_lower = item_name.lower()
-    favorite_lower = favorite.lower()
+    key = (item_name, favorite)
+    score = _FUZZY_SCORES.get(key)
+    if score is None:
+        item_lower = item_name.lower()
+        favorite_lower = favorite.lower()
+        score = max(scorer(item_lower, favorite_lower) for scorer in _FUZZY_SCORERS)
+        _FUZZY_SCORES[key] = score
+    return score
+
+
+def prime_fuzzy_scores(item_names: Iterable[str], favorites: Iterable[str]) -> None:
+    """Precompute fuzzy scores for every (item name, favorite) pair.
+
+    Runs each strategy once over the whole name x favorite matrix with
+    rapidfuzz.process.cdist, which is much cheaper than scoring pairs one
+    by one from the decision loop.
+
+    Args:
+        item_names: Names of every item any vendor can offer
+        favorites: Every student's favorite food (Q8_LunchChoice)
+    """
+    names = list(dict.fromkeys(item_names))
+    favs = list(dict.fromkeys(favorites))
+    if not names or not favs:
+        return
 
-    # Try multiple matching strategies and take the best
-    scores = [
-        fuzz.ratio(item_lower, favorite_lower),
-        fuzz.partial_ratio(item_lower, favorite_lower),
-        fuzz.token_sort_ratio(item_lower, favorite_lower),
-        fuzz.token_set_ratio(item_lower, favorite_lower),
-    ]
+    names_lower = [name.lower() for name in names]
+    favs_lower = [fav.lower() for fav in favs]
+    best = None
+    for scorer in _FUZZY_SCORERS:
+        scores = process.cdist(names_lower, favs_lower, scorer=scorer, dtype=np.float64)
+        best = scores if best is None else np.maximum(best, scores, out=best)
 
-    return max(scores)
+    for name, row in zip(names, best.tolist()):
+        for fav, score in zip(favs, row):
+            _FUZZY_SCORES[(name, fav)] = score
 
 
 def _get_drink_category_rank(item: MenuItem, profile: StudentProfile) -> int:
@@ -61,24 +100,48 @@ def _get_drink_category_rank(item: MenuItem, profile: StudentProfile) -> int:
     Returns:
         Rank 1-5 (1 is best, 5 is worst/unranked)
     """
-    category = item.category.lower()
-
-    category_to_rank = {
-        "energy": profile.energy_drink_rank,
-        "soda": profile.soda_rank,
-        "juice": profile.juice_rank,
-        "water": profile.water_rank,
-        "milk": profile.coffee_tea_rank,  # Grouped with coffee/tea in survey
-        "coffee": profile.coffee_tea_rank,
-    }
-
-    return category_to_rank.get(category, 5)
+    return profile.drink_ranks.get(item.category_lower, 5)
+
+
+# Food categories and the favorite-food keywords that signal each one
+_CATEGORY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    # Healthy items match healthy-sounding favorites
+    "healthy": ("salad", "veggie", "fruit", "yogurt", "grilled", "wrap"),
+    # Fried items match indulgent favorites
+    "fried": ("fries", "burger", "tenders", "rings", "corn dog", "nachos", "cheese"),
+    # Sweet items match dessert favorites
+    "sweet": ("brownie", "cookie", "ice cream", "churro", "cinnamon", "funnel", "parfait"),
+    # Savory items match main dish favorites
+    "savory": ("bowl", "wrap", "sandwich", "burrito", "chicken", "beef", "pork", "tacos"),
+}
+
+# Preference score when an item's category matches the favorite food
+_CATEGORY_MATCH_SCORES: Dict[str, float] = {
+    "healthy": 0.75,
+    "fried": 0.75,
+    "sweet": 0.75,
+    "savory": 0.70,
+}
+
+
+@lru_cache(maxsize=None)
+def _favorite_categories(favorite: str) -> FrozenSet[str]:
+    """Get the food categories whose keywords appear in a favorite food.
+
+    Favorites are fixed per student, so each one is only scanned once.
+    """
+    favorite_lower = favorite.lower()
+    return frozenset(
+        category
+        for category, keywords in _CATEGORY_KEYWORDS.items()
+        if any(kw in favorite_lower for kw in keywords)
+    )
 
 
 def _score_preference(
     item: MenuItem,
     profile: StudentProfile,
-) -> tuple[float, int]:
+) -> tuple[float, float]:
     """Score item based on preference match.
 
     Args:
@@ -98,42 +161,18 @@ def _score_preference(
         return 0.85, fuzzy_score
 
     # For drinks, use category-based ranking
-    if item.item_type == ITEM_TYPE_DRINK:
+    if item.item_type is ITEM_TYPE_DRINK:
         rank = _get_drink_category_rank(item, profile)
         # Convert rank (1-5) to score (1.0 - 0.2)
         drink_score = (6 - rank) / 5.0
         return max(drink_score, 0.3), fuzzy_score
 
     # For food, check category alignment with favorite food
-    favorite_lower = profile.q8_lunch_choice.lower()
-    category = item.category.lower()
-
-    # Category matching based on favorite food characteristics
-    if category == "healthy":
-        # Healthy items match healthy-sounding favorites
-        healthy_keywords = ["salad", "veggie", "fruit", "yogurt", "grilled", "wrap"]
-        if any(kw in favorite_lower for kw in healthy_keywords):
-            return 0.75, fuzzy_score
-
-    elif category == "fried":
-        # Fried items match indulgent favorites
-        fried_keywords = ["fries", "burger", "tenders", "rings", "corn dog", "nachos", "cheese"]
-        if any(kw in favorite_lower for kw in fried_keywords):
-            return 0.75, fuzzy_score
-
-    elif category == "sweet":
-        # Sweet items match dessert favorites
-        sweet_keywords = ["brownie", "cookie", "ice cream", "churro", "cinnamon", "funnel", "parfait"]
-        if any(kw in favorite_lower for kw in sweet_keywords):
-            return 0.75, fuzzy_score
-
-    elif category == "savory":
-        # Savory items match main dish favorites
-        savory_keywords = ["bowl", "wrap", "sandwich", "burrito", "chicken", "beef", "pork", "tacos"]
-        if any(kw in favorite_lower for kw in savory_keywords):
-            return 0.70, fuzzy_score
-
-    elif category == "snack":
+    category = item.category_lower
+    if category in _favorite_categories(profile.q8_lunch_choice):
+        return _CATEGORY_MATCH_SCORES[category], fuzzy_score
+
+    if category == "snack":
         # Snacks have moderate appeal
         return 0.50, fuzzy_score
 
@@ -141,6 +180,24 @@ def _score_preference(
     return 0.40, fuzzy_score
 
 
+def _cached_preference(
+    item: MenuItem,
+    profile: StudentProfile,
+) -> Tuple[float, float]:
+    """Memoized _score_preference.
+
+    Preference depends only on the item's name, type and category and on
+    the fixed profile, never on the daily state, so each student scores
+    each distinct item once per run.
+    """
+    cache = profile.preference_cache
+    key = (item.name, item.item_type, item.category_lower)
+    result = cache.get(key)
+    if result is None:
+        result = cache[key] = _score_preference(item, profile)
+    return result
+
+
 def _score_affordability(
     item: MenuItem,
     state: StudentDailyState,
@@ -168,8 +225,8 @@ def _score_mood_health(
     Returns:
         Score from 0-1
     """
-    # Normalize health rating to 0-1
-    health_score = item.health_rating / 10.0
+    # Health rating normalized to 0-1
+    health_score = item.health_score
 
     if state.mood == "healthy":
         # Healthy mood prefers high health rating
@@ -183,7 +240,7 @@ def _calculate_bonuses(
     item: MenuItem,
     profile: StudentProfile,
     state: StudentDailyState,
-    fuzzy_score: int,
+    fuzzy_score: float,
 ) -> float:
     """Calculate multiplicative bonuses.
 
@@ -204,29 +261,26 @@ def _calculate_bonuses(
     elif fuzzy_score >= FUZZY_THRESHOLD_MEDIUM:
         bonus *= BONUS_FUZZY_MATCH_MEDIUM  # +50% for medium confidence match
 
-    # Sweet/savory preference bonuses
-    wants_sweet = SWEET_PREFERENCE_VALUES.get(profile.q7_wants_sweet, False)
-    prefers_savory = profile.q7_wants_sweet == "No, I prefer savory"
+    features = item.feature_mask
 
-    if wants_sweet and item.sub_type == "sweet":
+    # Sweet/savory preference bonuses
+    if profile.wants_sweet and features & FEATURE_SWEET:
         bonus *= BONUS_SWEET
-    elif prefers_savory and item.sub_type == "savory":
+    elif profile.prefers_savory and features & FEATURE_SAVORY:
         bonus *= BONUS_SAVORY
 
     # Energy boost for drowsy students
-    if state.is_drowsy and item.energy_boost:
+    if state.is_drowsy and features & FEATURE_ENERGY_BOOST:
         bonus *= BONUS_ENERGY
 
     # High calorie bonus for active/high metabolism students
-    is_active = profile.q5_activity_level in HIGH_ACTIVITY_LEVELS
-    has_high_metabolism = profile.q3_metabolism in HIGH_METABOLISM_VALUES
-    if (is_active or has_high_metabolism) and item.calories >= HIGH_CALORIE_THRESHOLD:
+    if (profile.is_active or profile.has_high_metabolism) and features & FEATURE_HIGH_CALORIE:
         bonus *= BONUS_HIGH_CALORIE
 
     # Category match bonus based on mood
-    if state.mood == "healthy" and item.category == "healthy":
+    if state.mood == "healthy" and features & FEATURE_HEALTHY:
         bonus *= BONUS_CATEGORY_MATCH
-    elif state.mood == "junk" and item.category in ("fried", "sweet"):
+    elif state.mood == "junk" and features & FEATURE_JUNK:
         bonus *= BONUS_CATEGORY_MATCH
 
     return bonus
@@ -249,15 +303,15 @@ def score_item(
     Returns:
         Total weighted score with bonuses applied
     """
-    # Base scores
-    preference_score, fuzzy_score = _score_preference(item, profile)
+    # Can't buy if not affordable; skip the preference work entirely
     affordability_score = _score_affordability(item, state)
-    mood_score = _score_mood_health(item, state)
-
-    # Can't buy if not affordable
     if affordability_score == 0:
         return 0.0
 
+    # Base scores
+    preference_score, fuzzy_score = _cached_preference(item, profile)
+    mood_score = _score_mood_health(item, state)
+
     # Weighted base score
     base_score = (
         WEIGHT_PREFERENCE * preference_score
@@ -271,3 +325,85 @@ def score_item(
     return base_score * bonus_multiplier
 
 
+def best_scoring_item(
+    items: Iterable[MenuItem],
+    profile: StudentProfile,
+    state: StudentDailyState,
+) -> Tuple[Optional[MenuItem], float]:
+    """Find the item with the highest score_item() score.
+
+    Equivalent to scoring every item with score_item() and keeping the first
+    strict maximum, but with the per-student terms hoisted out of the loop
+    and the scoring helpers inlined, since this runs for every vendor menu
+    of every student every day.
+
+    Args:
+        items: Candidate menu items
+        profile: Student's permanent profile
+        state: Student's daily state
+
+    Returns:
+        Tuple of (best item or None, its score); None when nothing is affordable
+    """
+    money = state.available_money
+    healthy_mood = state.mood == "healthy"
+
+    # Bonus multipliers that apply to this student today, by feature bit
+    sweet_bonus = FEATURE_SWEET if profile.wants_sweet else 0
+    savory_bonus = FEATURE_SAVORY if profile.prefers_savory else 0
+    energy_bonus = FEATURE_ENERGY_BOOST if state.is_drowsy else 0
+    calorie_bonus = (
+        FEATURE_HIGH_CALORIE if profile.is_active or profile.has_high_metabolism else 0
+    )
+    if healthy_mood:
+        category_bonus = FEATURE_HEALTHY
+    elif state.mood == "junk":
+        category_bonus = FEATURE_JUNK
+    else:
+        category_bonus = 0
+
+    best_item = None
+    best_score = 0.0
+
+    for item in items:
+        price = item.price
+        if price > money:
+            continue  # Can't afford
+
+        preference_score, fuzzy_score = _cached_preference(item, profile)
+        affordability_score = 0.3 + ((money - price) / money) * 0.7
+        if healthy_mood:
+            mood_score = item.health_score
+        else:
+            mood_score = 1.0 - item.health_score
+
+        score = (
+            WEIGHT_PREFERENCE * preference_score
+            + WEIGHT_AFFORDABILITY * affordability_score
+            + WEIGHT_MOOD_HEALTH * mood_score
+        )
+
+        # Same multipliers, in the same order, as _calculate_bonuses
+        bonus = 1.0
+        if fuzzy_score >= FUZZY_THRESHOLD_HIGH:
+            bonus *= BONUS_FUZZY_MATCH_HIGH
+        elif fuzzy_score >= FUZZY_THRESHOLD_MEDIUM:
+            bonus *= BONUS_FUZZY_MATCH_MEDIUM
+        features = item.feature_mask
+        if features & sweet_bonus:
+            bonus *= BONUS_SWEET
+        elif features & savory_bonus:
+            bonus *= BONUS_SAVORY
+        if features & energy_bonus:
+            bonus *= BONUS_ENERGY
+        if features & calorie_bonus:
+            bonus *= BONUS_HIGH_CALORIE
+        if features & category_bonus:
+            bonus *= BONUS_CATEGORY_MATCH
+
+        score *= bonus
+        if score > best_score:
+            best_score = score
+            best_item = item
+
+    return best_item, best_score
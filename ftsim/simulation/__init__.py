@@ -1,7 +1,12 @@
 """Simulation package."""
 
 from .engine import SimulationEngine
-from .daily_state import generate_daily_states
+from .daily_state import DailyStateGenerator, generate_daily_states
 from .decision import make_decision
 
-__all__ = ["SimulationEngine", "generate_daily_states", "make_decision"]
+__all__ = [
+    "SimulationEngine",
+    "DailyStateGenerator",
+    "generate_daily_states",
+    "make_decision",
+]
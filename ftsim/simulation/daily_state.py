@@ -1,11 +1,13 @@
 """Daily state generation for students."""
 
-import random
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
 
 from ..models.student import StudentProfile, StudentDailyState
 from ..config import (
-    MONEY_MAPPING,
+    MONEY_TABLE,
     HEALTHY_MOOD_PROBABILITY,
     HEALTH_GOAL_MODIFIER,
     DROWSINESS_CHANCE,
@@ -15,55 +17,85 @@ from ..config import (
 
 def _get_base_money(profile: StudentProfile) -> float:
     """Get base money for student based on Q4 and income level."""
-    key = (profile.q4_money_for_lunch, profile.income_level)
-    return MONEY_MAPPING.get(key, 8.50)  # Default to medium
+    return MONEY_TABLE[profile.q4_money_for_lunch][profile.income_level]
 
 
 def _get_healthy_mood_probability(profile: StudentProfile) -> float:
     """Get probability of healthy mood based on Q6 and Q2."""
-    base_prob = HEALTHY_MOOD_PROBABILITY.get(
-        profile.q6_healthy_importance, 0.50
-    )
-    modifier = HEALTH_GOAL_MODIFIER.get(profile.q2_health_goal, 0.0)
+    base_prob = HEALTHY_MOOD_PROBABILITY[profile.q6_healthy_importance]
+    modifier = HEALTH_GOAL_MODIFIER[profile.q2_health_goal]
     return max(0.0, min(1.0, base_prob + modifier))
 
 
-def generate_daily_state(profile: StudentProfile) -> StudentDailyState:
-    """Generate randomized daily state for a single student.
-
-    Args:
-        profile: The student's immutable profile
+@dataclass
+class DailyStateGenerator:
+    """Draws every student's daily state with a few vectorized RNG calls.
 
-    Returns:
-        StudentDailyState with randomized values for the day
+    Base money and healthy-mood probability depend only on the immutable
+    profiles, so they are computed once up front.
     """
-    # Calculate money with Gaussian variance
-    base_money = _get_base_money(profile)
-    variance = base_money * MONEY_VARIANCE
-    available_money = max(0.0, random.gauss(base_money, variance / 2))
-
-    # Determine mood (healthy or junk)
-    healthy_prob = _get_healthy_mood_probability(profile)
-    mood = "healthy" if random.random() < healthy_prob else "junk"
 
-    # Determine drowsiness
-    is_drowsy = random.random() < DROWSINESS_CHANCE
-
-    return StudentDailyState(
-        student_id=profile.student_id,
-        available_money=round(available_money, 2),
-        mood=mood,
-        is_drowsy=is_drowsy,
-    )
-
-
-def generate_daily_states(profiles: List[StudentProfile]) -> List[StudentDailyState]:
+    profiles: List[StudentProfile]
+
+    # Per-student distribution parameters, in profile order
+    _base_money: np.ndarray = field(init=False, repr=False, compare=False)
+    _money_stddev: np.ndarray = field(init=False, repr=False, compare=False)
+    _healthy_prob: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._base_money = np.array(
+            [_get_base_money(profile) for profile in self.profiles], dtype=np.float64
+        )
+        # Gaussian variance is a fraction of base money; stddev is half of it
+        self._money_stddev = self._base_money * MONEY_VARIANCE / 2
+        self._healthy_prob = np.array(
+            [_get_healthy_mood_probability(profile) for profile in self.profiles],
+            dtype=np.float64,
+        )
+
+    def generate(self, rng: np.random.Generator) -> List[StudentDailyState]:
+        """Generate today's states for all students.
+
+        Args:
+            rng: Random generator to draw from
+
+        Returns:
+            List of StudentDailyState objects, one per profile, in profile order
+        """
+        n = len(self.profiles)
+        money = np.maximum(rng.normal(self._base_money, self._money_stddev), 0.0).tolist()
+        healthy = (rng.random(n) < self._healthy_prob).tolist()
+        drowsy = (rng.random(n) < DROWSINESS_CHANCE).tolist()
+
+        return [
+            StudentDailyState(
+                student_id=profile.student_id,
+                available_money=round(available_money, 2),
+                mood="healthy" if is_healthy else "junk",
+                is_drowsy=is_drowsy,
+            )
+            for profile, available_money, is_healthy, is_drowsy in zip(
+                self.profiles, money, healthy, drowsy
+            )
+        ]
+
+
+def generate_daily_states(
+    profiles: List[StudentProfile],
+    rng: Optional[np.random.Generator] = None,
+) -> List[StudentDailyState]:
     """Generate daily states for all students.
 
+    Callers generating states repeatedly for the same profiles should keep a
+    DailyStateGenerator instead.
+
     Args:
         profiles: List of student profiles
+        rng: Random generator to draw from (None for fresh entropy)
 
     Returns:
         List of StudentDailyState objects, one per student
     """
-    return [generate_daily_state(profile) for profile in profiles]
+    if rng is None:
+        rng = np.random.default_rng()
+    return DailyStateGenerator(profiles).generate(rng)
@@ -1,32 +1,33 @@
 """Student decision logic for the food truck simulation."""
 
 import random
-from typing import List, Optional, Union
+from itertools import chain
+from typing import Iterable, List, Optional, Union
 from dataclasses import dataclass
 
 from ..models.menu_item import MenuItem
 from ..models.student import StudentProfile, StudentDailyState
 from ..models.vendors import FoodTruck, SchoolLunch, FastFood
-from ..scoring.scorer import score_item
+from ..scoring.scorer import best_scoring_item, score_item
 from ..config import (
     LOSS_REASON_SCHOOL_LUNCH,
-    LOSS_REASON_PRICE,
     LOSS_REASON_STOCKOUT,
     LOSS_REASON_FASTFOOD,
-    ITEM_TYPE_FOOD,
-    ITEM_TYPE_DRINK,
+    SUB_TYPE_SWEET,
     PENALTY_NO_DRINK,
     EXTRA_PURCHASE_BASE_PROB,
     EXTRA_PURCHASE_PROB_STDDEV,
     EXTRA_PURCHASE_DECAY,
     EXTRA_PURCHASE_MIN_SCORE_RATIO,
+    VENDOR_SCHOOL,
+    VENDOR_FASTFOOD,
 )
 
 # Any vendor type that exposes the duck-typed menu interface
 Vendor = Union[FoodTruck, SchoolLunch, FastFood]
 
 
-@dataclass
+@dataclass(slots=True)
 class TruckOption:
     """Best food/drink option from a specific vendor."""
     truck: Vendor
@@ -45,28 +46,8 @@ def _find_best_items_for_truck(
     Returns:
         TruckOption with (truck, best_food, best_drink, combined_score)
     """
-    available_food = truck.get_available_food()
-    available_drinks = truck.get_available_drinks()
-
-    best_food = None
-    best_food_score = 0.0
-
-    best_drink = None
-    best_drink_score = 0.0
-
-    # Score food items
-    for item in available_food:
-        score = score_item(item, profile, state)
-        if score > best_food_score:
-            best_food_score = score
-            best_food = item
-
-    # Score drink items
-    for item in available_drinks:
-        score = score_item(item, profile, state)
-        if score > best_drink_score:
-            best_drink_score = score
-            best_drink = item
+    best_food, best_food_score = best_scoring_item(truck.get_available_food(), profile, state)
+    best_drink, best_drink_score = best_scoring_item(truck.get_available_drinks(), profile, state)
 
     # Combined score considers whether student can afford food + drink
     combined_score = best_food_score
@@ -87,18 +68,22 @@ def _find_best_items_for_truck(
 
 
 def _find_best_items(
-    trucks: List[FoodTruck],
+    vendors: Iterable[Vendor],
     profile: StudentProfile,
     state: StudentDailyState,
 ) -> Optional[TruckOption]:
-    """Find best food and drink items for student across all trucks.
+    """Find best food and drink items for student across vendors.
+
+    Tracks the running maximum while scanning instead of collecting every
+    option first. Vendors without any affordable food are skipped.
 
     Returns:
-        TruckOption for the best truck, or None if no options available
+        TruckOption for the first vendor with the highest combined score,
+        or None if no options available
     """
     best_option: Optional[TruckOption] = None
 
-    for truck in trucks:
+    for truck in vendors:
         option = _find_best_items_for_truck(truck, profile, state)
         if option.best_food is not None:
             if best_option is None or option.combined_score > best_option.combined_score:
@@ -114,6 +99,7 @@ def _try_buy_extras(
     main_food: MenuItem,
     main_food_score: float,
     remaining_money: float,
+    rng: random.Random,
 ) -> float:
     """Try to buy additional food items from the same truck after the main purchase.
 
@@ -124,15 +110,15 @@ def _try_buy_extras(
     Returns:
         Updated remaining_money after any extra purchases.
     """
-    purchased_names = {item.name for item in state.purchased_items}
+    purchased_names = set(state.purchased_names)
     current_prob = EXTRA_PURCHASE_BASE_PROB
-    main_is_sweet = main_food.sub_type == "sweet"
+    main_is_sweet = main_food.sub_type is SUB_TYPE_SWEET
     min_score = main_food_score * EXTRA_PURCHASE_MIN_SCORE_RATIO
 
     while True:
         # Gaussian probability check
-        desire = max(0.0, random.gauss(current_prob, EXTRA_PURCHASE_PROB_STDDEV))
-        if random.random() > desire:
+        desire = max(0.0, rng.gauss(current_prob, EXTRA_PURCHASE_PROB_STDDEV))
+        if rng.random() > desire:
             break
 
         # Temporarily set available_money for accurate affordability scoring
@@ -154,7 +140,7 @@ def _try_buy_extras(
             if item.price > remaining_money:
                 continue
             # Sub_type rule: sweet main -> only sweet extras
-            if main_is_sweet and item.sub_type != "sweet":
+            if main_is_sweet and item.sub_type is not SUB_TYPE_SWEET:
                 continue
 
             score = score_item(item, profile, state)
@@ -172,8 +158,7 @@ def _try_buy_extras(
         if not truck.sell_item(best_extra):
             break  # Stockout
 
-        state.purchased_items.append(best_extra)
-        state.total_spent += best_extra.price
+        state.add_purchase(best_extra)
         remaining_money -= best_extra.price
         purchased_names.add(best_extra.name)
 
@@ -189,6 +174,7 @@ def make_decision(
     trucks: List[FoodTruck],
     school_lunch: SchoolLunch,
     fast_food: FastFood,
+    rng: Optional[random.Random] = None,
 ) -> None:
     """Process a student's lunch decision.
 
@@ -196,50 +182,37 @@ def make_decision(
     vendor with the highest combined score.
 
     Modifies state in place to record the decision outcome.
+
+    Args:
+        rng: Random generator for extra purchases (default: the global
+            random module)
     """
-    # ---- Collect candidate options from all vendors ----
-
-    # Food trucks
-    best_truck = _find_best_items(trucks, profile, state)
-
-    # School lunch (always available)
-    school_option = _find_best_items_for_truck(school_lunch, profile, state)
-
-    # Burger joint (only if student has car)
-    burger_option: Optional[TruckOption] = None
-    if profile.has_car:
-        burger_option = _find_best_items_for_truck(fast_food, profile, state)
-
-    # ---- Check if trucks have any stock at all ----
-    all_available: List[MenuItem] = []
-    for truck in trucks:
-        all_available.extend(truck.get_available_items())
-
-    # ---- Pick the best overall vendor ----
-    candidates: List[TruckOption] = []
-    if best_truck and best_truck.best_food:
-        candidates.append(best_truck)
-    if school_option and school_option.best_food:
-        candidates.append(school_option)
-    if burger_option and burger_option.best_food:
-        candidates.append(burger_option)
-
-    if not candidates:
+    if rng is None:
+        rng = random
+
+    # ---- Pick the best overall vendor in a single pass ----
+
+    # Food trucks, then school lunch (always available), then the burger
+    # joint (only if student has car); ties go to the earlier vendor
+    vendors = chain(trucks, (school_lunch,), (fast_food,) if profile.has_car else ())
+    winner = _find_best_items(vendors, profile, state)
+
+    if winner is None:
         # Nothing available anywhere — default to school lunch loss
         state.chose_school_lunch = True
         state.loss_reason = LOSS_REASON_STOCKOUT
         return
 
-    winner = max(candidates, key=lambda c: c.combined_score)
-
     # ---- Act on the winner ----
 
-    if isinstance(winner.truck, SchoolLunch):
+    vendor_kind = winner.truck.VENDOR_KIND
+
+    if vendor_kind == VENDOR_SCHOOL:
         state.chose_school_lunch = True
         state.loss_reason = LOSS_REASON_SCHOOL_LUNCH
         return
 
-    if isinstance(winner.truck, FastFood):
+    if vendor_kind == VENDOR_FASTFOOD:
         state.chose_fast_food = True
         state.loss_reason = LOSS_REASON_FASTFOOD
         return
@@ -250,26 +223,24 @@ def make_decision(
     best_drink = winner.best_drink
     remaining_money = state.available_money
 
-    # Try to buy food
-    if best_food and best_food.price <= remaining_money:
-        if truck.sell_item(best_food):
-            state.purchased_items.append(best_food)
-            state.total_spent += best_food.price
-            state.purchased_from_truck = truck.name
-            remaining_money -= best_food.price
+    # Try to buy food; _find_best_items only returns vendors with an
+    # affordable best_food, so no price check is needed here
+    if truck.sell_item(best_food):
+        state.add_purchase(best_food)
+        state.purchased_from_truck = truck.name
+        remaining_money -= best_food.price
 
     # Try to also buy drink if affordable (from same truck)
     if best_drink and best_drink.price <= remaining_money:
         if truck.sell_item(best_drink):
-            state.purchased_items.append(best_drink)
-            state.total_spent += best_drink.price
+            state.add_purchase(best_drink)
             remaining_money -= best_drink.price
 
     # Try to buy extra food items (only if main food was purchased)
-    if state.purchased_items and best_food:
+    if state.purchased_items:
         main_food_score = score_item(best_food, profile, state)
         remaining_money = _try_buy_extras(
-            truck, profile, state, best_food, main_food_score, remaining_money
+            truck, profile, state, best_food, main_food_score, remaining_money, rng
         )
 
     # Check if purchase was successful
@@ -1,22 +1,72 @@
 """Main simulation engine for the food truck simulation."""
 
+import math
+import os
 import random
-from typing import List, Dict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterator, List, Dict, Optional
+
+import numpy as np
 
 from ..config import NON_PURCHASING_MEAN, NON_PURCHASING_STDDEV
-from ..models.student import StudentProfile, StudentDailyState
-from ..models.menu_item import MenuItem
+from ..models.student import StudentProfile
 from ..models.vendors import FoodTruck, SchoolLunch, FastFood
 from ..output.results import (
     DailyResult,
+    StudentStates,
     TruckDailyResult,
     TruckAggregateResult,
     CompetitionAggregateResult,
 )
-from .daily_state import generate_daily_states
+from ..output.reporter import print_daily_summary
+from ..scoring.scorer import _FUZZY_SCORES, prime_fuzzy_scores
+from .daily_state import DailyStateGenerator
 from .decision import make_decision
 
 
+# Engine copy used by day workers, set once per process by _init_worker
+_worker_engine: Optional["SimulationEngine"] = None
+
+
+def _init_worker(engine: "SimulationEngine") -> None:
+    """Install the engine in a worker process."""
+    global _worker_engine
+    _worker_engine = engine
+    # Fuzzy scores are a module-level cache; refill it only if the worker
+    # process did not inherit the parent's
+    if not _FUZZY_SCORES:
+        engine._prime_fuzzy_scores()
+
+
+def _run_worker_day(day: int, seed: np.random.SeedSequence) -> DailyResult:
+    """Run one day on the worker's engine."""
+    return _worker_engine._run_day(day, seed)
+
+
+@dataclass(slots=True)
+class _RunningStat:
+    """Running mean and variance of a per-day metric (Welford's method)."""
+
+    count: int = 0
+    mean: float = 0.0
+    _m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def relative_half_width(self) -> float:
+        """Half-width of the 95% confidence interval relative to the mean."""
+        if self.count < 2 or self.mean == 0:
+            return math.inf
+        stderr = math.sqrt(self._m2 / (self.count - 1) / self.count)
+        return 1.96 * stderr / abs(self.mean)
+
+
 class SimulationEngine:
     """Main simulation engine that runs the food truck simulation."""
 
@@ -26,14 +76,31 @@ class SimulationEngine:
         trucks: List[FoodTruck],
         num_days: int = 30,
         verbose: bool = False,
-    ):
+        seed: Optional[int] = None,
+        workers: int = 1,
+        keep_student_states: bool = True,
+        keep_daily: bool = True,
+        convergence_tol: Optional[float] = None,
+        min_days: int = 10,
+    ) -> None:
         """Initialize the simulation.
 
         Args:
             students: List of student profiles
             trucks: List of food trucks competing
-            num_days: Number of days to simulate
+            num_days: Number of days to simulate (the cap when convergence_tol is set)
             verbose: Whether to print daily summaries
+            seed: Seed for the run's random streams (None for fresh entropy)
+            workers: Number of processes to simulate days in (1 runs in-process,
+                0 uses one per CPU)
+            keep_student_states: Whether daily results keep every student's
+                final state; only exports read them
+            keep_daily: Whether the aggregate result keeps every DailyResult;
+                totals are accumulated as days finish either way
+            convergence_tol: Stop early once the 95% confidence half-width of
+                both mean daily revenue and mean customer rate falls below
+                this fraction of the mean (None always runs num_days)
+            min_days: Fewest days to run before stopping early
         """
         self.students = students
         self.trucks = trucks
@@ -41,179 +108,249 @@ class SimulationEngine:
         self.fast_food = FastFood()
         self.num_days = num_days
         self.verbose = verbose
-
-    def _run_day(self, day: int) -> DailyResult:
+        self.workers = workers or os.cpu_count() or 1
+        self.keep_student_states = keep_student_states
+        self.keep_daily = keep_daily
+        self.convergence_tol = convergence_tol
+        self.min_days = min_days
+
+        # Each day draws from its own child of a sequence built from this
+        # entropy, so results do not depend on which process runs the day
+        self._entropy = np.random.SeedSequence(seed).entropy
+        self._state_generator = DailyStateGenerator(students)
+
+        # Truck name -> position in self.trucks, for the per-day counters
+        self._truck_index: Dict[str, int] = {truck.name: idx for idx, truck in enumerate(trucks)}
+
+        # Item names per truck, in menu order
+        self._menu_names: List[List[str]] = [[item.name for item in truck.menu] for truck in trucks]
+
+        # Profiles may be shared with earlier engines (the loader caches
+        # seeded loads); start their preference memos over for these menus
+        for profile in students:
+            profile.preference_cache.clear()
+
+        self._prime_fuzzy_scores()
+
+    def _prime_fuzzy_scores(self) -> None:
+        """Score every (item, favorite) pair up front in one batched pass."""
+        item_names = [item.name for truck in self.trucks for item in truck.menu]
+        item_names.extend(item.name for item in self.school_lunch.pool)
+        item_names.extend(item.name for item in self.fast_food.menu)
+        prime_fuzzy_scores(item_names, (p.q8_lunch_choice for p in self.students))
+
+    def _run_day(self, day: int, seed: np.random.SeedSequence) -> DailyResult:
         """Run simulation for a single day.
 
         Args:
             day: Day number (1-indexed)
+            seed: This day's seed sequence
 
         Returns:
             DailyResult with day's outcomes
         """
+        # This day's own streams: NumPy for the vectorized draws, a
+        # random.Random for the school lunch menu, attendance and extras,
+        # seeded from the day's first child sequence so the two streams are
+        # independent (built directly, as spawn() would mutate the day seed)
+        rng = np.random.default_rng(seed)
+        py_seed = np.random.SeedSequence(seed.entropy, spawn_key=(*seed.spawn_key, 0))
+        py_rng = random.Random(int.from_bytes(py_seed.generate_state(4).tobytes(), "little"))
+
         # Reset inventory for all trucks
         for truck in self.trucks:
             truck.reset_inventory()
 
         # Generate school lunch daily menu
-        self.school_lunch.generate_daily_menu()
+        self.school_lunch.generate_daily_menu(py_rng)
 
         # Generate daily states for all students
-        daily_states = generate_daily_states(self.students)
+        daily_states = self._state_generator.generate(rng)
 
         # Determine how many students are non-purchasing today (absent / brought lunch)
-        num_non_purchasing = int(round(random.gauss(NON_PURCHASING_MEAN, NON_PURCHASING_STDDEV)))
+        num_non_purchasing = int(round(py_rng.gauss(NON_PURCHASING_MEAN, NON_PURCHASING_STDDEV)))
         num_non_purchasing = max(0, min(len(daily_states), num_non_purchasing))
 
-        # Randomly exclude them
-        if num_non_purchasing > 0:
-            random.shuffle(daily_states)
-            daily_states = daily_states[num_non_purchasing:]
-
-        # Create lookup from student_id to profile
-        profile_lookup = {p.student_id: p for p in self.students}
-
-        # Shuffle order (simulates random arrival)
-        random.shuffle(daily_states)
-
-        # Track results per truck
-        truck_revenue: Dict[str, float] = {truck.name: 0.0 for truck in self.trucks}
-        truck_customers: Dict[str, int] = {truck.name: 0 for truck in self.trucks}
-        truck_items_sold: Dict[str, Dict[str, int]] = {truck.name: {} for truck in self.trucks}
-        truck_stockouts: Dict[str, Dict[str, int]] = {
-            truck.name: {item.name: 0 for item in truck.menu} for truck in self.trucks
-        }
+        # One permutation gives both a random set of absentees (the first
+        # num_non_purchasing positions) and a random arrival order for the rest
+        arrival_order = rng.permutation(len(daily_states))[num_non_purchasing:].tolist()
 
-        losses_by_reason: Dict[str, int] = {}
-        student_state_dicts = []
+        # Track results per truck position; items sold per menu position
+        trucks = self.trucks
+        truck_index = self._truck_index
+        truck_revenue: List[int] = [0] * len(trucks)  # cents
+        truck_customers: List[int] = [0] * len(trucks)
+        truck_items_sold: List[List[int]] = [[0] * len(truck.menu) for truck in trucks]
 
-        # Track inventory to detect when items sell out
-        prev_inventory: Dict[str, Dict[str, int]] = {
-            truck.name: {item.name: item.current_inventory for item in truck.menu}
-            for truck in self.trucks
-        }
-
-        # Process each student
-        for state in daily_states:
-            profile = profile_lookup[state.student_id]
+        # Process each student in arrival order; states are in the same
+        # order as self.students
+        students = self.students
+        arrivals = [daily_states[idx] for idx in arrival_order]
+        for idx, state in zip(arrival_order, arrivals):
+            profile = students[idx]
 
             # Make decision
-            make_decision(profile, state, self.trucks, self.school_lunch, self.fast_food)
+            make_decision(profile, state, trucks, self.school_lunch, self.fast_food, py_rng)
 
             # Record results
             if state.purchased_items and state.purchased_from_truck:
-                truck_name = state.purchased_from_truck
-                truck_customers[truck_name] += 1
-                truck_revenue[truck_name] += state.total_spent
+                truck_idx = truck_index[state.purchased_from_truck]
+                truck_customers[truck_idx] += 1
+                truck_revenue[truck_idx] += state.total_spent_cents
+                items_sold = truck_items_sold[truck_idx]
                 for item in state.purchased_items:
-                    truck_items_sold[truck_name][item.name] = (
-                        truck_items_sold[truck_name].get(item.name, 0) + 1
-                    )
-
-            if state.loss_reason:
-                losses_by_reason[state.loss_reason] = (
-                    losses_by_reason.get(state.loss_reason, 0) + 1
-                )
-
-            # Check for new stockouts per truck
-            for truck in self.trucks:
-                for item in truck.menu:
-                    if (
-                        prev_inventory[truck.name][item.name] > 0
-                        and item.current_inventory == 0
-                    ):
-                        truck_stockouts[truck.name][item.name] = 1
-                    prev_inventory[truck.name][item.name] = item.current_inventory
-
-            # Store state for export
-            student_state_dicts.append(state.to_dict())
-
-        # Build truck results
+                    items_sold[item.menu_idx] += 1
+
+        # Count losses and store states for export once per day
+        losses_by_reason = dict(Counter(filter(None, [state.loss_reason for state in arrivals])))
+        if self.keep_student_states:
+            student_states = StudentStates.from_states(arrivals)
+        else:
+            student_states = StudentStates()
+
+        # Build name-keyed truck results
+        menu_names = self._menu_names
         truck_results: Dict[str, TruckDailyResult] = {}
-        for truck in self.trucks:
+        for truck_idx, truck in enumerate(trucks):
+            items_sold = {
+                name: count
+                for name, count in zip(menu_names[truck_idx], truck_items_sold[truck_idx])
+                if count
+            }
+            stockout_flags = truck.get_sold_out_flags()
             truck_results[truck.name] = TruckDailyResult(
                 truck_name=truck.name,
-                revenue=truck_revenue[truck.name],
-                customers=truck_customers[truck.name],
-                items_sold=truck_items_sold[truck.name],
-                stockouts=truck_stockouts[truck.name],
+                revenue_cents=truck_revenue[truck_idx],
+                customers=truck_customers[truck_idx],
+                items_sold=items_sold,
+                stockouts=dict(zip(menu_names[truck_idx], stockout_flags.tolist())),
+                items_sold_counts=np.array(truck_items_sold[truck_idx], dtype=np.int32),
+                stockout_flags=stockout_flags,
             )
 
         return DailyResult(
             day=day,
             truck_results=truck_results,
             losses_by_reason=losses_by_reason,
-            total_students=len(daily_states),
+            total_students=len(arrival_order),
             school_lunch_menu=[item.name for item in self.school_lunch.daily_menu],
-            student_states=student_state_dicts,
+            student_states=student_states,
         )
 
+    def _iter_days(self) -> Iterator[DailyResult]:
+        """Simulate every day, yielding results in day order.
+
+        With more than one worker, days are farmed out to a process pool;
+        each worker receives a copy of the engine once, at startup.
+        """
+        days = range(1, self.num_days + 1)
+        day_seeds = np.random.SeedSequence(self._entropy).spawn(self.num_days)
+
+        if self.workers <= 1 or self.num_days <= 1:
+            for day, seed in zip(days, day_seeds):
+                yield self._run_day(day, seed)
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.workers, self.num_days),
+            initializer=_init_worker,
+            initargs=(self,),
+        )
+        try:
+            yield from executor.map(_run_worker_day, days, day_seeds)
+        finally:
+            # Drop queued days if the caller stopped early
+            executor.shutdown(cancel_futures=True)
+
     def run(self) -> CompetitionAggregateResult:
         """Run the full simulation.
 
         Returns:
             CompetitionAggregateResult with all simulation data
         """
-        daily_results: List[DailyResult] = []
+        truck_names = [truck.name for truck in self.trucks]
+        menu_names = self._menu_names
 
-        for day in range(1, self.num_days + 1):
-            result = self._run_day(day)
-            daily_results.append(result)
+        # Running totals, folded in as each day arrives so day results can
+        # be dropped when nothing downstream reads them
+        daily_results: List[DailyResult] = []
+        num_days = 0
+        revenue_rows: List[List[int]] = []
+        customer_rows: List[List[int]] = []
+        items_sold_totals = [np.zeros(len(names), dtype=np.int64) for names in menu_names]
+        stockout_totals = [np.zeros(len(names), dtype=np.int64) for names in menu_names]
+        total_losses: Counter = Counter()
+        total_students_served = 0
+        revenue_stat = _RunningStat()
+        customer_rate_stat = _RunningStat()
+
+        for result in self._iter_days():
+            num_days += 1
+            day_results = [result.truck_results[name] for name in truck_names]
+            revenue_rows.append([tr.revenue_cents for tr in day_results])
+            customer_rows.append([tr.customers for tr in day_results])
+            for idx, tr in enumerate(day_results):
+                items_sold_totals[idx] += tr.items_sold_counts
+                stockout_totals[idx] += tr.stockout_flags
+            total_losses.update(result.losses_by_reason)
+            total_students_served += result.total_students
+
+            if self.keep_daily:
+                daily_results.append(result)
 
             if self.verbose:
-                from ..output.reporter import print_daily_summary
                 print_daily_summary(result)
 
+            if self.convergence_tol is not None:
+                revenue_stat.add(result.revenue_cents)
+                customer_rate_stat.add(result.customers / (result.total_students or 1))
+                if (
+                    num_days >= self.min_days
+                    and revenue_stat.relative_half_width() < self.convergence_tol
+                    and customer_rate_stat.relative_half_width() < self.convergence_tol
+                ):
+                    break
+
+        # Per-day revenue (cents) and customers as day x truck arrays
+        shape = (num_days, len(truck_names))
+        daily_revenue_cents = np.array(revenue_rows, dtype=np.int64).reshape(shape)
+        daily_customers = np.array(customer_rows, dtype=np.int64).reshape(shape)
+        revenue_totals = daily_revenue_cents.sum(axis=0).tolist()
+        customer_totals = daily_customers.sum(axis=0).tolist()
+
         # Aggregate results per truck
         truck_aggregate: Dict[str, TruckAggregateResult] = {}
 
-        for truck in self.trucks:
-            truck_name = truck.name
-            total_revenue = sum(
-                r.truck_results[truck_name].revenue for r in daily_results
-            )
-            total_customers = sum(
-                r.truck_results[truck_name].customers for r in daily_results
-            )
-
-            # Aggregate items sold for this truck
-            total_items_sold: Dict[str, int] = {}
-            for result in daily_results:
-                for item_name, count in result.truck_results[truck_name].items_sold.items():
-                    total_items_sold[item_name] = total_items_sold.get(item_name, 0) + count
+        for idx, truck_name in enumerate(truck_names):
+            total_revenue_cents = revenue_totals[idx]
+            total_customers = customer_totals[idx]
 
-            # Aggregate stockouts for this truck
-            total_stockouts: Dict[str, int] = {}
-            for result in daily_results:
-                for item_name, sold_out in result.truck_results[truck_name].stockouts.items():
-                    total_stockouts[item_name] = total_stockouts.get(item_name, 0) + sold_out
+            names = menu_names[idx]
 
             truck_aggregate[truck_name] = TruckAggregateResult(
                 truck_name=truck_name,
-                total_revenue=total_revenue,
+                total_revenue_cents=total_revenue_cents,
                 total_customers=total_customers,
-                total_items_sold=total_items_sold,
-                total_stockouts=total_stockouts,
-                avg_daily_revenue=total_revenue / self.num_days,
-                avg_daily_customers=total_customers / self.num_days,
+                total_items_sold={
+                    name: count
+                    for name, count in zip(names, items_sold_totals[idx].tolist())
+                    if count
+                },
+                total_stockouts=dict(zip(names, stockout_totals[idx].tolist())),
+                avg_daily_revenue=total_revenue_cents / 100 / num_days,
+                avg_daily_customers=total_customers / num_days,
             )
 
-        # Aggregate losses across all trucks
-        total_losses: Dict[str, int] = {}
-        for result in daily_results:
-            for reason, count in result.losses_by_reason.items():
-                total_losses[reason] = total_losses.get(reason, 0) + count
-
         # Determine winner
-        winner = max(truck_aggregate.keys(), key=lambda t: truck_aggregate[t].total_revenue)
-
-        total_students_served = sum(r.total_students for r in daily_results)
+        winner = max(truck_aggregate.keys(), key=lambda t: truck_aggregate[t].total_revenue_cents)
 
         return CompetitionAggregateResult(
-            total_days=self.num_days,
+            total_days=num_days,
             truck_results=truck_aggregate,
-            total_losses_by_reason=total_losses,
+            total_losses_by_reason=dict(total_losses),
             total_students_served=total_students_served,
             winner=winner,
             daily_results=daily_results,
+            daily_revenue_cents=daily_revenue_cents,
+            daily_customers=daily_customers,
         )
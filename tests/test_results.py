@@ -0,0 +1,37 @@
+"""Tests for result dataclasses."""
+
+import unittest
+from unittest import mock
+
+from ftsim.output import results
+from ftsim.output.results import TruckDailyResult
+
+
+def _truck_result() -> TruckDailyResult:
+    return TruckDailyResult(
+        truck_name="Taco Town",
+        revenue_cents=1250,
+        customers=3,
+        items_sold={"Jalapeño Poppers": 2, "Agua \"Fresca\"": 1},
+        stockouts={"Jalapeño Poppers": 0, "Agua \"Fresca\"": 1},
+    )
+
+
+class ItemsSoldJsonTest(unittest.TestCase):
+    """items_sold_json must not depend on whether orjson is installed."""
+
+    @unittest.skipIf(results.orjson is None, "orjson not installed")
+    def test_fallback_matches_orjson(self) -> None:
+        expected = _truck_result().items_sold_json
+        with mock.patch.object(results, "orjson", None):
+            actual = _truck_result().items_sold_json
+        self.assertEqual(actual, expected)
+
+    def test_fallback_is_compact_and_unescaped(self) -> None:
+        with mock.patch.object(results, "orjson", None):
+            encoded = _truck_result().items_sold_json
+        self.assertEqual(encoded, '{"Jalapeño Poppers":2,"Agua \\"Fresca\\"":1}')
+
+
+if __name__ == "__main__":
+    unittest.main()
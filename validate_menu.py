@@ -54,9 +54,13 @@ Examples:
     print(f"Total Items: {len(menu_data.items)}")
     print()
 
-    # Categorize items
-    food_items = [item for item in menu_data.items if item.item_type == "food"]
-    drink_items = [item for item in menu_data.items if item.item_type == "drink"]
+    # Categorize items in one pass
+    food_items, drink_items = [], []
+    for item in menu_data.items:
+        if item.item_type == "food":
+            food_items.append(item)
+        elif item.item_type == "drink":
+            drink_items.append(item)
 
     print(f"Food Items ({len(food_items)}):")
     for item in food_items: